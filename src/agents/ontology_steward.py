@@ -535,8 +535,8 @@ class OntologySteward(BaseAgent):
         qid = template_qid.strip()
 
         # QID format: must be fully qualified
-        logger.debug(f"Seal check: qid='{qid}' match={bool(QID_RE.match(qid))}")
-        if (not qid) or ("@" not in qid) or (not QID_RE.match(qid)):
+        logger.debug(f"Seal check: qid='{qid}' match={bool(QID_RE.fullmatch(qid))}")
+        if (not qid) or ("@" not in qid) or (not QID_RE.fullmatch(qid)):
             raise ValueError("Invalid template_qid format for seal")
 
         template_id, version = qid.split("@", 1)
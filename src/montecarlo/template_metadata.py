@@ -11,25 +11,39 @@ INVARIANTS:
 """
 
 import ast
+import bisect
 import hashlib
 import inspect
 import json
+import linecache
 import logging
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from .templates import Template
 
+logger = logging.getLogger(__name__)
+
+
+# Prebuilt canonical encoders (json.dumps with keyword options builds a new
+# JSONEncoder on every call). Output is byte-identical to the json.dumps form.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+_STRICT_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 
 # =============================================================================
 # Template Version
 # =============================================================================
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class TemplateVersion:
     """
     Semantic version for templates.
@@ -44,8 +58,9 @@ class TemplateVersion:
     patch: int
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def parse(cls, s: str) -> "TemplateVersion":
-        """Parse version string like '1.2.3'."""
+        """Parse version string like '1.2.3' (memoized; instances are immutable)."""
         parts = s.split(".")
         if len(parts) != 3:
             raise ValueError(f"Invalid version format: {s} (expected X.Y.Z)")
@@ -131,13 +146,17 @@ class TemplateStatus(str, Enum):
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True)
 class TemplateSpec:
     """
     Declared contract for a template.
 
     This is what gets hashed for spec_hash.
     Changes to this require version bumps.
+
+    Specs are immutable: sorted list views are built at construction and the
+    canonical JSON and spec_hash are memoized on first use. Call _invalidate()
+    after mutating a nested list/dict of a spec in place.
     """
 
     template_id: str
@@ -166,26 +185,71 @@ class TemplateSpec:
     # Phase 16.2: Governed epistemic semantics
     epistemic: EpistemicSemantics = field(default_factory=EpistemicSemantics)
 
+    # Derived views and memoized hashing artifacts (not part of the contract)
+    qualified_id: str = field(default="", init=False, repr=False, compare=False)
+    _sorted_invariants: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _sorted_depends_on: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _sorted_capabilities: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _sorted_required_tests: Tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _param_schema_json: str = field(default="", init=False, repr=False, compare=False)
+    _output_schema_json: str = field(default="", init=False, repr=False, compare=False)
+    _canonical_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _spec_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "template_id", sys.intern(self.template_id))
+        object.__setattr__(self, "qualified_id", sys.intern(f"{self.template_id}@{self.version}"))
+        object.__setattr__(self, "_sorted_invariants", tuple(sorted(self.invariants)))
+        object.__setattr__(self, "_sorted_depends_on", tuple(sorted(self.depends_on)))
+        object.__setattr__(
+            self, "_sorted_capabilities", tuple(sorted(c.value for c in self.capabilities))
+        )
+        object.__setattr__(self, "_sorted_required_tests", tuple(sorted(self.required_tests)))
+        # Schemas are the bulk of the spec; serialize them once as JSON fragments
+        object.__setattr__(self, "_param_schema_json", _CANONICAL_ENCODER.encode(self.param_schema))
+        object.__setattr__(
+            self, "_output_schema_json", _CANONICAL_ENCODER.encode(self.output_schema)
+        )
+
+    def _invalidate(self) -> None:
+        """Rebuild sorted views and drop memoized canonical JSON and spec_hash."""
+        self.__post_init__()
+        object.__setattr__(self, "_canonical_json", None)
+        object.__setattr__(self, "_spec_hash", None)
+
     def to_canonical_json(self) -> str:
         """Return canonical JSON for hashing (sorted keys, no whitespace)."""
-        data = {
-            "template_id": self.template_id,
-            "version": str(self.version),
-            "description": self.description,
-            "param_schema": self.param_schema,
-            "output_schema": self.output_schema,
-            "invariants": sorted(self.invariants),
-            "depends_on": sorted(self.depends_on),
-            "capabilities": sorted(c.value for c in self.capabilities),
-            "required_tests": sorted(self.required_tests),
-            "deterministic": self.deterministic,
-            "epistemic": self.epistemic.to_canonical_dict(),
+        if self._canonical_json is None:
+            object.__setattr__(self, "_canonical_json", self._build_canonical_json())
+        return self._canonical_json
+
+    def _build_canonical_json(self) -> str:
+        # Assembled from per-field fragments; byte-identical to encoding the
+        # whole dict with sort_keys=True and compact separators.
+        encode = _CANONICAL_ENCODER.encode
+        fragments = {
+            "template_id": encode(self.template_id),
+            "version": encode(str(self.version)),
+            "description": encode(self.description),
+            "param_schema": self._param_schema_json,
+            "output_schema": self._output_schema_json,
+            "invariants": encode(self._sorted_invariants),
+            "depends_on": encode(self._sorted_depends_on),
+            "capabilities": encode(self._sorted_capabilities),
+            "required_tests": encode(self._sorted_required_tests),
+            "deterministic": encode(self.deterministic),
+            "epistemic": encode(self.epistemic.to_canonical_dict()),
         }
-        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return "{" + ",".join(f'"{k}":{v}' for k, v in sorted(fragments.items())) + "}"
 
     def spec_hash(self) -> str:
         """Return SHA256 hash of canonical spec JSON."""
-        return hashlib.sha256(self.to_canonical_json().encode()).hexdigest()
+        if self._spec_hash is None:
+            digest = hashlib.sha256(self.to_canonical_json().encode()).hexdigest()
+            object.__setattr__(self, "_spec_hash", digest)
+        return self._spec_hash
 
 
 # =============================================================================
@@ -198,7 +262,7 @@ def sha256_json_strict(data: Any) -> str:
     Strict hash of JSON-serializable data.
     Raises exception on failure instead of fallback.
     """
-    s = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    s = _STRICT_ENCODER.encode(data)
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
@@ -217,19 +281,37 @@ def normalize_ast(source: str) -> str:
         return source
 
 
-def compute_code_hash(obj: Any, strict: bool = False) -> str:
+# Source of a class/function is invariant for the lifetime of a process, so
+# successful code hashes are cached per object. Failures are never cached.
+_CODE_HASH_CACHE: "WeakKeyDictionary[Any, str]" = WeakKeyDictionary()
+
+
+def compute_code_hash(obj: Any, strict: bool = False, refresh: bool = False) -> str:
     """
     Compute hash of the entire template class implementation.
 
     Uses AST normalization on the class source code.
     If strict=True, raises exception on failure instead of returning placeholder.
+    If refresh=True, re-reads the source instead of using the per-class cache.
     """
+    # Resolve to class if an instance is passed
+    target = obj if inspect.isclass(obj) or inspect.isfunction(obj) else type(obj)
+    if not refresh:
+        cached = _CODE_HASH_CACHE.get(target)
+        if cached is not None:
+            return cached
     try:
-        # Resolve to class if an instance is passed
-        target = obj if inspect.isclass(obj) or inspect.isfunction(obj) else type(obj)
+        if refresh:
+            # Re-check the file so a refresh never hashes lines linecache loaded
+            # before the source was edited.
+            filename = inspect.getsourcefile(target)
+            if filename:
+                linecache.checkcache(filename)
         source = inspect.getsource(target)
         normalized = normalize_ast(source)
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        code_hash = hashlib.sha256(normalized.encode()).hexdigest()
+        _CODE_HASH_CACHE[target] = code_hash
+        return code_hash
     except (OSError, TypeError) as e:
         if strict:
             raise RuntimeError(f"Failed to compute code hash for {target}: {e}")
@@ -252,7 +334,7 @@ def compute_code_hash_strict(cls: type) -> str:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemplateMetadata:
     """
     Governance metadata for a template version.
@@ -289,29 +371,47 @@ class TemplateMetadata:
     tainted_reason: Optional[str] = None
     superseded_by: Optional[str] = None  # e.g. "bootstrap_ci@1.0.1"
 
-    @property
-    def qualified_id(self) -> str:
-        """Return qualified ID like 'bootstrap_ci@1.0.0'."""
-        return f"{self.template_id}@{self.version}"
+    # Derived views, built once in __post_init__
+    version_str: str = field(default="", init=False, repr=False, compare=False)
+    qualified_id: str = field(default="", init=False, repr=False, compare=False)
+
+    # ISO-8601 views of the timestamps, built once for to_dict()
+    _approved_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _frozen_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _tainted_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "template_id", sys.intern(self.template_id))
+        # Normalize plain strings to the enum singleton so status checks can use `is`
+        object.__setattr__(self, "status", TemplateStatus(self.status))
+        object.__setattr__(self, "version_str", sys.intern(str(self.version)))
+        # Qualified ID like 'bootstrap_ci@1.0.0'
+        object.__setattr__(
+            self, "qualified_id", sys.intern(f"{self.template_id}@{self.version_str}")
+        )
+        for name in ("approved_at", "frozen_at", "tainted_at"):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, f"_{name}_iso", value.isoformat())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             "template_id": self.template_id,
-            "version": str(self.version),
+            "version": self.version_str,
             "spec_hash": self.spec_hash,
             "code_hash": self.code_hash,
             "deps_hash": self.deps_hash,
             "status": self.status.value,
             "approved_by": self.approved_by,
-            "approved_at": self.approved_at.isoformat() if self.approved_at else None,
+            "approved_at": self._approved_at_iso,
             "frozen": self.frozen,
-            "frozen_at": self.frozen_at.isoformat() if self.frozen_at else None,
+            "frozen_at": self._frozen_at_iso,
             "first_evidence_id": self.first_evidence_id,
             "freeze_claim_id": self.freeze_claim_id,
             "freeze_scope_lock_id": self.freeze_scope_lock_id,
             "tainted": self.tainted,
-            "tainted_at": self.tainted_at.isoformat() if self.tainted_at else None,
+            "tainted_at": self._tainted_at_iso,
             "tainted_reason": self.tainted_reason,
             "superseded_by": self.superseded_by,
         }
@@ -348,12 +448,6 @@ class TemplateMetadata:
 # Versioned Template Registry
 # =============================================================================
 
-# =============================================================================
-# Versioned Template Registry
-# =============================================================================
-
-logger = logging.getLogger(__name__)
-
 
 class VersionedTemplateRegistry:
     """
@@ -366,6 +460,15 @@ class VersionedTemplateRegistry:
         self._templates: Dict[str, "Template"] = {}
         self._metadata: Dict[str, TemplateMetadata] = {}
         self._specs: Dict[str, TemplateSpec] = {}
+        # template_id -> [(version, qualified_id)] kept sorted ascending
+        self._by_template_id: Dict[str, List[Tuple[TemplateVersion, str]]] = defaultdict(list)
+        # qualified_id -> manifest entry, kept current by _set_metadata()
+        self._manifest_rows: Dict[str, Dict[str, Any]] = {}
+        # qualified_id -> (spec_hash, code_hash) last computed by verify_hashes,
+        # reused only by verify_hashes(use_cache=True)
+        self._verify_cache: Dict[str, Tuple[str, str]] = {}
+        # status -> {qualified_id: registration index} for entries in that status
+        self._by_status: Dict[TemplateStatus, Dict[str, int]] = {s: {} for s in TemplateStatus}
 
     def register(
         self,
@@ -378,7 +481,41 @@ class VersionedTemplateRegistry:
 
         Returns the qualified ID.
         """
-        qualified_id = f"{spec.template_id}@{spec.version}"
+        qualified_id, metadata = self._prepare(template, spec, metadata)
+        self._insert(template, spec, metadata)
+        return qualified_id
+
+    def register_many(
+        self,
+        items: List[Tuple["Template", TemplateSpec]],
+    ) -> List[str]:
+        """
+        Register a batch of versioned templates.
+
+        Every item is hashed and validated before any is inserted, so a
+        failure leaves the registry unchanged. Returns qualified IDs in order.
+        """
+        prepared = []
+        seen = set()
+        for template, spec in items:
+            qualified_id, metadata = self._prepare(template, spec, None)
+            if qualified_id in seen:
+                raise ValueError(f"Template already registered: {qualified_id}")
+            seen.add(qualified_id)
+            prepared.append((template, spec, metadata))
+
+        for template, spec, metadata in prepared:
+            self._insert(template, spec, metadata)
+        return [spec.qualified_id for _, spec, _ in prepared]
+
+    def _prepare(
+        self,
+        template: "Template",
+        spec: TemplateSpec,
+        metadata: Optional[TemplateMetadata],
+    ) -> Tuple[str, TemplateMetadata]:
+        """Compute hashes and build/validate metadata without touching registry state."""
+        qualified_id = spec.qualified_id
 
         if qualified_id in self._templates:
             raise ValueError(f"Template already registered: {qualified_id}")
@@ -408,11 +545,42 @@ class VersionedTemplateRegistry:
                     f"code_hash mismatch (provided={metadata.code_hash}, computed={code_hash})"
                 )
 
+        return qualified_id, metadata
+
+    def _insert(
+        self,
+        template: "Template",
+        spec: TemplateSpec,
+        metadata: TemplateMetadata,
+    ) -> None:
+        qualified_id = spec.qualified_id
         self._templates[qualified_id] = template
         self._specs[qualified_id] = spec
+        self._set_metadata(qualified_id, metadata)
+        bisect.insort(self._by_template_id[spec.template_id], (spec.version, qualified_id))
+
+    def _set_metadata(self, qualified_id: str, metadata: TemplateMetadata) -> None:
+        """Store metadata, refresh the derived manifest entry and drop verify state."""
+        previous = self._metadata.get(qualified_id)
+        if previous is None:
+            self._by_status[metadata.status][qualified_id] = len(self._metadata)
+        elif previous.status is not metadata.status:
+            index = self._by_status[previous.status].pop(qualified_id)
+            self._by_status[metadata.status][qualified_id] = index
         self._metadata[qualified_id] = metadata
-
-        return qualified_id
+        self._verify_cache.pop(qualified_id, None)
+        spec = self._specs[qualified_id]
+        self._manifest_rows[qualified_id] = {
+            "template_id": metadata.template_id,
+            "version": str(metadata.version),
+            "spec_hash": metadata.spec_hash,
+            "code_hash": metadata.code_hash,
+            "deps_hash": metadata.deps_hash,
+            "depends_on": spec._sorted_depends_on,
+            "capabilities": spec._sorted_capabilities,
+            "frozen": metadata.frozen,
+            "status": metadata.status.value,
+        }
 
     def get(self, qualified_id: str) -> Optional["Template"]:
         """Get a template by qualified ID."""
@@ -428,24 +596,19 @@ class VersionedTemplateRegistry:
 
     def get_latest(self, template_id: str) -> Optional["Template"]:
         """Get the latest version of a template."""
-        versions = [
-            (TemplateVersion.parse(qid.split("@")[1]), qid)
-            for qid in self._templates
-            if qid.startswith(f"{template_id}@")
-            and self._metadata[qid].status == TemplateStatus.ACTIVE
-        ]
-        if not versions:
-            return None
-        versions.sort(reverse=True)
-        return self._templates[versions[0][1]]
+        for _, qid in reversed(self._by_template_id.get(template_id, ())):
+            if self._metadata[qid].status is TemplateStatus.ACTIVE:
+                return self._templates[qid]
+        return None
 
     def list_all(self) -> List[str]:
         """List all registered qualified IDs."""
         return sorted(self._templates.keys())
 
     def list_by_status(self, status: TemplateStatus) -> List[str]:
-        """List templates by status."""
-        return [qid for qid, meta in self._metadata.items() if meta.status == status]
+        """List templates by status, in registration order."""
+        bucket = self._by_status[status]
+        return sorted(bucket, key=bucket.__getitem__)
 
     def freeze(
         self,
@@ -488,7 +651,7 @@ class VersionedTemplateRegistry:
             freeze_claim_id=claim_id,
             freeze_scope_lock_id=scope_lock_id,
         )
-        self._metadata[qualified_id] = new_meta
+        self._set_metadata(qualified_id, new_meta)
         return new_meta
 
     def taint(
@@ -511,7 +674,7 @@ class VersionedTemplateRegistry:
             tainted_reason=reason,
             superseded_by=superseded_by,
         )
-        self._metadata[qualified_id] = new_meta
+        self._set_metadata(qualified_id, new_meta)
         return new_meta
 
     def deprecate(self, qualified_id: str) -> TemplateMetadata:
@@ -521,11 +684,35 @@ class VersionedTemplateRegistry:
             raise ValueError(f"Template not found: {qualified_id}")
 
         new_meta = replace(metadata, status=TemplateStatus.DEPRECATED)
-        self._metadata[qualified_id] = new_meta
+        self._set_metadata(qualified_id, new_meta)
         return new_meta
 
-    def verify_hashes(self, qualified_id: str) -> bool:
-        """Verify that current hashes match stored metadata."""
+    def verify_hashes(self, qualified_id: str, use_cache: bool = False) -> bool:
+        """
+        Verify that current hashes match stored metadata.
+
+        By default the spec hash is recomputed and the template source re-read,
+        so drift since registration is always detected. use_cache=True opts
+        into reusing the hashes from this entry's last verification (until its
+        metadata changes) for cheap repeated checks.
+        """
+        if use_cache:
+            metadata = self._metadata.get(qualified_id)
+            cached = self._verify_cache.get(qualified_id)
+            if cached is not None and metadata is not None:
+                return cached == (metadata.spec_hash, metadata.code_hash)
+            return self._verify_hashes(qualified_id, force=False)
+        return self._verify_hashes(qualified_id, force=True)
+
+    def verify_all(self, use_cache: bool = False) -> Dict[str, bool]:
+        """Verify every registered template; returns qualified_id -> hashes match."""
+        return {qid: self.verify_hashes(qid, use_cache=use_cache) for qid in self._templates}
+
+    def verify_hashes_force(self, qualified_id: str) -> bool:
+        """Verify hashes by recomputing spec and code hashes from scratch (audit path)."""
+        return self._verify_hashes(qualified_id, force=True)
+
+    def _verify_hashes(self, qualified_id: str, force: bool) -> bool:
         template = self._templates.get(qualified_id)
         spec = self._specs.get(qualified_id)
         metadata = self._metadata.get(qualified_id)
@@ -533,26 +720,23 @@ class VersionedTemplateRegistry:
         if not all([template, spec, metadata]):
             return False
 
-        current_spec_hash = spec.spec_hash()
-        current_code_hash = compute_code_hash(type(template), strict=True)
+        if force:
+            spec._invalidate()
+        current = (
+            spec.spec_hash(),
+            compute_code_hash(type(template), strict=True, refresh=force),
+        )
+        self._verify_cache[qualified_id] = current
 
-        return current_spec_hash == metadata.spec_hash and current_code_hash == metadata.code_hash
+        return current == (metadata.spec_hash, metadata.code_hash)
 
     def to_manifest(self) -> Dict[str, Any]:
         """Export registry to manifest format for CI."""
-        manifest = {}
-        for qid in self._templates:
-            metadata = self._metadata[qid]
-            spec = self._specs[qid]
-            manifest[qid] = {
-                "template_id": metadata.template_id,
-                "version": str(metadata.version),
-                "spec_hash": metadata.spec_hash,
-                "code_hash": metadata.code_hash,
-                "deps_hash": metadata.deps_hash,
-                "depends_on": sorted(spec.depends_on),
-                "capabilities": sorted(c.value for c in spec.capabilities),
-                "frozen": metadata.frozen,
-                "status": metadata.status.value,
+        return {
+            qid: {
+                **row,
+                "depends_on": list(row["depends_on"]),
+                "capabilities": list(row["capabilities"]),
             }
-        return manifest
+            for qid, row in self._manifest_rows.items()
+        }
@@ -13,14 +13,22 @@ INVARIANTS:
 import hashlib
 import json
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .template_metadata import TemplateMetadata, TemplateStatus, TemplateVersion
 
+try:
+    from typedb.driver import TransactionType
+except ImportError:  # InMemoryTemplateStore works without the driver
+    TransactionType = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,11 +38,82 @@ def _escape(s: str) -> str:
     return s.replace("\\", "\\\\").replace('"', '\\"')
 
 
+@lru_cache(maxsize=1024)
+def _escape_id(s: str) -> str:
+    """`_escape` for identity fields (template ids, versions, actors) that repeat per query."""
+    return _escape(s)
+
+
+def _attribute_value(concept: Any) -> Any:
+    return concept.as_attribute().get_value()
+
+
+def _value_value(concept: Any) -> Any:
+    return concept.as_value().get()
+
+
+def _concept_iid(concept: Any) -> Any:
+    return concept.get_iid()
+
+
+def _decoder_for(concept: Any) -> Callable[[Any], Any]:
+    """Pick the decoder for a TypeDB 3 concept of unknown kind."""
+    if hasattr(concept, "is_attribute") and concept.is_attribute():
+        return _attribute_value
+    if hasattr(concept, "is_value") and concept.is_value():
+        return _value_value
+    if hasattr(concept, "get_iid"):
+        return _concept_iid
+    return str
+
+
+@lru_cache(maxsize=1)
+def _iso_at(epoch_seconds: int) -> str:
+    # `created-at` in schema is `datetime` (not `datetime-tz`), so no timezone suffix.
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_seconds))
+
+
 def _iso_now() -> str:
     """Return TypeDB `datetime` literal string (timezone-naive UTC)."""
-    dt = datetime.now(timezone.utc).replace(microsecond=0)
-    # `created-at` in schema is `datetime` (not `datetime-tz`), so drop timezone suffix.
-    return dt.replace(tzinfo=None).isoformat(timespec="seconds")
+    # Second granularity: calls within the same second reuse the formatted literal.
+    return _iso_at(int(time.time()))
+
+
+# Same output as json.dumps(..., sort_keys=True), without rebuilding an encoder per event
+_EVENT_JSON_ENCODER = json.JSONEncoder(sort_keys=True)
+
+# Attribute blocks are compiled once and filled with pre-escaped values per call.
+_METADATA_ATTRS_TEMPLATE = (
+    'has template-id "{tid}", has version "{version}", '
+    'has spec-hash "{spec}", has code-hash "{code}", has status "{status}", '
+    "has frozen {frozen}, has tainted {tainted}, has created-at {now}{deps_tail}"
+)
+_DEPS_TAIL_TEMPLATE = ', has deps-hash "{deps}"'
+
+_EVENT_ATTRS_TEMPLATE = (
+    'has entity-id "{evt_id}", has template-id "{tid}", has version "{version}", '
+    'has event-type "{event_type}", has actor "{actor}", has rationale "{rationale}", '
+    'has json "{json}", has created-at {now}'
+)
+
+_TAINT_ATTRS_TEMPLATE = (
+    'has tainted true, has tainted-at {now}, has tainted-reason "{reason}"{superseded_tail}'
+)
+_SUPERSEDED_TAIL_TEMPLATE = ', has superseded-by "{superseded}"'
+
+_INSERT_IF_ABSENT_GUARD = (
+    'match not {{ $x isa template-metadata, has template-id "{tid}", has version "{version}"; }};\n'
+)
+
+_METADATA_FETCH_KEYS = ("spec", "code", "status", "frozen", "tainted")
+_METADATA_ROW_DECODERS = dict.fromkeys(("tid", "v", *_METADATA_FETCH_KEYS), _attribute_value)
+
+_FREEZE_ATTRS_TEMPLATE = (
+    'has frozen true, has frozen-at {now}, has first-evidence-id "{evidence}"'
+    "{claim_tail}{scope_tail}"
+)
+_CLAIM_TAIL_TEMPLATE = ', has freeze-claim-id "{claim}"'
+_SCOPE_TAIL_TEMPLATE = ', has freeze-scope-lock-id "{scope}"'
 
 
 def _make_template_event_id(
@@ -107,13 +186,96 @@ class TemplateStore(ABC):
         """Append audit event."""
         pass
 
+    def insert_many(self, metadatas: List[TemplateMetadata]) -> None:
+        """Insert several metadata records; stores may override to batch writes."""
+        for metadata in metadatas:
+            self.insert_metadata(metadata)
+
+    def append_events(self, events: List[Dict[str, Any]]) -> None:
+        """Append several audit events (dicts of `append_event` kwargs)."""
+        for event in events:
+            self.append_event(**event)
+
+    def freeze_many(self, freezes: List[Dict[str, Any]]) -> None:
+        """Freeze several templates (dicts of `freeze` kwargs); stores may batch."""
+        for kwargs in freezes:
+            self.freeze(**kwargs)
+
+
+class _EventColumns(Sequence):
+    """
+    Append-only event log stored column-wise (one list per field).
+
+    Indexing still yields per-event dicts, built on demand; `columns` exposes
+    the raw lists for analytic export. `created_at` is kept as UTC epoch
+    nanoseconds and only turned into a datetime when a row is read.
+    """
+
+    FIELDS = (
+        "template_id",
+        "version",
+        "event_type",
+        "actor",
+        "rationale",
+        "extra_json",
+        "created_at",
+    )
+
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.FIELDS}
+        self._appenders = [self.columns[name].append for name in self.FIELDS]
+        # Row positions per template_id / event_type, for filter() without a scan
+        self._by_template: Dict[str, List[int]] = {}
+        self._by_type: Dict[str, List[int]] = {}
+
+    def append(self, template_id, version, event_type, actor, rationale, extra_json) -> None:
+        position = len(self)
+        self._by_template.setdefault(template_id, []).append(position)
+        self._by_type.setdefault(event_type, []).append(position)
+        values = (
+            template_id,
+            version,
+            event_type,
+            actor,
+            rationale,
+            extra_json,
+            time.time_ns(),
+        )
+        for add, value in zip(self._appenders, values):
+            add(value)
+
+    def __len__(self) -> int:
+        return len(self.columns["created_at"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        row = {name: self.columns[name][index] for name in self.FIELDS}
+        row["created_at"] = datetime.fromtimestamp(row["created_at"] / 1e9, timezone.utc)
+        return row
+
+    def filter(
+        self, template_id: Optional[str] = None, event_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return events matching every given field, in insertion order."""
+        if template_id is None and event_type is None:
+            return self[:]
+        if template_id is None:
+            positions = self._by_type.get(event_type, [])
+        elif event_type is None:
+            positions = self._by_template.get(template_id, [])
+        else:
+            of_type = set(self._by_type.get(event_type, ()))
+            positions = [i for i in self._by_template.get(template_id, ()) if i in of_type]
+        return [self[i] for i in positions]
+
 
 class InMemoryTemplateStore(TemplateStore):
     """In-memory implementation for testing."""
 
     def __init__(self):
         self.metadata: Dict[str, TemplateMetadata] = {}  # qualified_id -> meta
-        self.events: List[Dict] = []
+        self.events = _EventColumns()
 
     def _qid(self, tid, v):
         return f"{tid}@{v}"
@@ -122,18 +284,12 @@ class InMemoryTemplateStore(TemplateStore):
         qid = metadata.qualified_id
         if qid in self.metadata:
             return
-        # Store a copy to simulate immutability
-        import copy
-
-        self.metadata[qid] = copy.deepcopy(metadata)
-        self.append_event(metadata.template_id, str(metadata.version), "registered", "system")
+        # TemplateMetadata is a frozen dataclass of immutable values, so aliasing is safe
+        self.metadata[qid] = metadata
+        self.append_event(metadata.template_id, metadata.version_str, "registered", "system")
 
     def get_metadata(self, template_id: str, version: str) -> Optional[TemplateMetadata]:
-        # Return copy to prevent mutation
-        import copy
-
-        meta = self.metadata.get(self._qid(template_id, version))
-        return copy.deepcopy(meta) if meta else None
+        return self.metadata.get(self._qid(template_id, version))
 
     def freeze(
         self, template_id, version, evidence_id, claim_id=None, scope_lock_id=None, actor="system"
@@ -179,17 +335,13 @@ class InMemoryTemplateStore(TemplateStore):
         self.append_event(template_id, version, "tainted", actor, rationale=reason)
 
     def append_event(self, template_id, version, event_type, actor, rationale="", extra_json=None):
-        self.events.append(
-            {
-                "template_id": template_id,
-                "version": version,
-                "event_type": event_type,
-                "actor": actor,
-                "rationale": rationale,
-                "extra_json": extra_json or {},
-                "created_at": datetime.now(timezone.utc),
-            }
-        )
+        self.events.append(template_id, version, event_type, actor, rationale, extra_json or {})
+
+    def filter_events(
+        self, template_id: Optional[str] = None, event_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return recorded events for a template and/or event type."""
+        return self.events.filter(template_id=template_id, event_type=event_type)
 
 
 class TypeDBTemplateStore(TemplateStore):
@@ -200,9 +352,17 @@ class TypeDBTemplateStore(TemplateStore):
     Logs all changes to template-lifecycle-event.
     """
 
-    def __init__(self, driver, database: str = "scientific_knowledge"):
+    BATCH_SIZE = 1000
+
+    def __init__(self, driver, database: str = "scientific_knowledge", bulk_options: Any = None):
         self.driver = driver
         self.database = database
+        # Optional typedb.driver.TransactionOptions for insert_many/append_events
+        # (e.g. a longer transaction_timeout_millis for large batches).
+        self.bulk_options = bulk_options
+        # Qualified ids seen in the database. Metadata is never deleted, so membership
+        # is a safe "already registered" answer that skips the existence read.
+        self._known_qids: Set[str] = set()
 
     @staticmethod
     def _exec_query(tx, query: str):
@@ -220,16 +380,36 @@ class TypeDBTemplateStore(TemplateStore):
 
         raise TypeError("Unsupported TypeDB query API")
 
-    def _write_query(self, query: str) -> None:
-        from typedb.driver import TransactionType
-
-        with self.driver.transaction(self.database, TransactionType.WRITE) as tx:
-            self._exec_query(tx, query)
+    def _bulk_transaction(self):
+        if self.bulk_options is None:
+            return self.driver.transaction(self.database, TransactionType.WRITE)
+        return self.driver.transaction(self.database, TransactionType.WRITE, self.bulk_options)
+
+    def _write_queries(self, queries: List[str], bulk: bool = False) -> None:
+        """Run `queries` in order inside one write transaction with a single commit."""
+        tx_context = (
+            self._bulk_transaction()
+            if bulk
+            else self.driver.transaction(self.database, TransactionType.WRITE)
+        )
+        with tx_context as tx:
+            for query in queries:
+                self._exec_query(tx, query)
             tx.commit()
 
-    def _read_query(self, query: str) -> List[Dict[str, Any]]:
-        from typedb.driver import TransactionType
+    def _write_query(self, query: str) -> None:
+        self._write_queries([query])
+
+    def _read_query(
+        self, query: str, decoders: Optional[Dict[str, Callable[[Any], Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a read query and return one dict per answer row.
 
+        `decoders` maps a column name (without `$`) to a callable that turns
+        its concept into a value. When given, rows are decoded through it
+        directly instead of probing each concept's kind.
+        """
         results: List[Dict[str, Any]] = []
         with self.driver.transaction(self.database, TransactionType.READ) as tx:
             answer = self._exec_query(tx, query)
@@ -238,21 +418,25 @@ class TypeDBTemplateStore(TemplateStore):
                 return results
 
             if hasattr(answer, "as_concept_rows"):
+                columns = None
                 for concept_row in answer.as_concept_rows():
+                    if columns is None:
+                        # Column layout is fixed per query: resolve keys/decoders once
+                        columns = []
+                        for col in concept_row.column_names():
+                            key = col[1:] if isinstance(col, str) and col.startswith("$") else col
+                            decoder = decoders.get(key) if decoders else None
+                            columns.append([col, key, decoder])
                     row: Dict[str, Any] = {}
-                    for col in concept_row.column_names():
-                        key = col[1:] if isinstance(col, str) and col.startswith("$") else col
+                    for column in columns:
+                        col, key, decoder = column
                         concept = concept_row.get(col)
-                        if concept is None:
-                            continue
-                        if hasattr(concept, "is_attribute") and concept.is_attribute():
-                            row[key] = concept.as_attribute().get_value()
-                        elif hasattr(concept, "is_value") and concept.is_value():
-                            row[key] = concept.as_value().get()
-                        elif hasattr(concept, "get_iid"):
-                            row[key] = concept.get_iid()
-                        else:
-                            row[key] = str(concept)
+                        if concept is not None:
+                            if decoder is None:
+                                # A variable's concept kind is fixed by the query, so
+                                # probe it on the first non-empty cell only.
+                                decoder = column[2] = _decoder_for(concept)
+                            row[key] = decoder(concept)
                     results.append(row)
                 return results
 
@@ -269,7 +453,66 @@ class TypeDBTemplateStore(TemplateStore):
 
         return results
 
-    def append_event(
+    def _fetch_query(self, query: str) -> List[Dict[str, Any]]:
+        """Run a `fetch` query and return its JSON-like documents."""
+        with self.driver.transaction(self.database, TransactionType.READ) as tx:
+            answer = self._exec_query(tx, query)
+            if answer is None:
+                return []
+            if hasattr(answer, "as_concept_documents"):
+                return list(answer.as_concept_documents())
+            return list(answer)
+
+    @staticmethod
+    def _metadata_block(metadata: TemplateMetadata, tid_esc: str, v_esc: str, now: str) -> str:
+        deps_tail = (
+            _DEPS_TAIL_TEMPLATE.format(deps=_escape(metadata.deps_hash))
+            if metadata.deps_hash
+            else ""
+        )
+        return _METADATA_ATTRS_TEMPLATE.format_map(
+            {
+                "tid": tid_esc,
+                "version": v_esc,
+                "spec": _escape(metadata.spec_hash),
+                "code": _escape(metadata.code_hash),
+                "status": _escape(metadata.status.value),
+                "frozen": "true" if metadata.frozen else "false",
+                "tainted": "true" if metadata.tainted else "false",
+                "now": now,
+                "deps_tail": deps_tail,
+            }
+        )
+
+    @staticmethod
+    def _event_block(
+        tid_esc: str,
+        v_esc: str,
+        event_type: str,
+        actor: str,
+        rationale_esc: str,
+        extra_json: Optional[Dict[str, Any]],
+        now: str,
+        evt_id: Optional[str] = None,
+    ) -> str:
+        """
+        Event attribute block. The identity pair and rationale arrive pre-escaped
+        because callers also splice them into the surrounding match/insert.
+        """
+        return _EVENT_ATTRS_TEMPLATE.format_map(
+            {
+                "evt_id": evt_id or f"tevt-{uuid.uuid4().hex[:12]}",
+                "tid": tid_esc,
+                "version": v_esc,
+                "event_type": _escape_id(event_type),
+                "actor": _escape_id(actor),
+                "rationale": rationale_esc,
+                "json": _escape(_EVENT_JSON_ENCODER.encode(extra_json)) if extra_json else "{}",
+                "now": now,
+            }
+        )
+
+    def _append_event_query(
         self,
         template_id: str,
         version: str,
@@ -277,94 +520,220 @@ class TypeDBTemplateStore(TemplateStore):
         actor: str,
         rationale: str = "",
         extra_json: Dict[str, Any] = None,
-    ) -> None:
-        # Generate event entity
-        evt_id = f"tevt-{uuid.uuid4().hex[:12]}"
-        now = _iso_now()
-        json_str = json.dumps(extra_json or {}, sort_keys=True)
-
-        query = f'''
+        created_at: Optional[str] = None,
+        position: int = 0,
+    ) -> str:
+        tid_esc = _escape_id(template_id)
+        v_esc = _escape_id(version)
+        created_at = created_at or _iso_now()
+        # Deterministic ID over the event's full content and its position in an
+        # append_events batch. Identical events written in the same second share
+        # an ID, so the entity-id @key rejects the second one instead of storing
+        # a duplicate.
+        content = _EVENT_JSON_ENCODER.encode(extra_json or {})
+        evt_id = _escape(
+            _make_template_event_id(
+                template_id,
+                version,
+                event_type,
+                f"{position}:{created_at}:{actor}:{rationale}:{content}",
+            )
+        )
+        event_block = self._event_block(
+            tid_esc,
+            v_esc,
+            event_type,
+            actor,
+            _escape(rationale),
+            extra_json,
+            created_at,
+            evt_id=evt_id,
+        )
+        return f'''
             match $m isa template-metadata,
-                has template-id "{_escape(template_id)}",
-                has version "{_escape(version)}";
+                has template-id "{tid_esc}",
+                has version "{v_esc}";
             insert 
                 $e isa template-lifecycle-event,
-                    has entity-id "{evt_id}",
-                    has template-id "{_escape(template_id)}",
-                    has version "{_escape(version)}",
-                    has event-type "{_escape(event_type)}",
-                    has actor "{_escape(actor)}",
-                    has rationale "{_escape(rationale)}",
-                    has json "{_escape(json_str)}",
-                    has created-at {now};
+                    {event_block};
                 ($m, $e) isa template-has-lifecycle-event;
         '''
+
+    def append_event(
+        self,
+        template_id: str,
+        version: str,
+        event_type: str,
+        actor: str,
+        rationale: str = "",
+        extra_json: Dict[str, Any] = None,
+    ) -> None:
+        query = self._append_event_query(
+            template_id, version, event_type, actor, rationale, extra_json
+        )
         self._write_query(query)
         logger.info(f"Appended event {event_type} for {template_id}@{version}")
 
+    def append_events(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Append many lifecycle events with one commit per `BATCH_SIZE` events.
+
+        Each event keeps its own match/insert query (a failed match must not
+        drop its neighbours), but they share a single write transaction.
+        """
+        for start in range(0, len(events), self.BATCH_SIZE):
+            chunk = events[start : start + self.BATCH_SIZE]
+            queries = [
+                self._append_event_query(**event, position=start + offset)
+                for offset, event in enumerate(chunk)
+            ]
+            self._write_queries(queries, bulk=True)
+        logger.info(f"Appended {len(events)} lifecycle events")
+
+    def _emit_insert_metadata(
+        self, buf: List[str], i: int, metadata: TemplateMetadata, now: str
+    ) -> None:
+        """Append one metadata entity, its "registered" event and their link to `buf`."""
+        m_var = f"$m{i}"
+        e_var = f"$e{i}"
+        tid_esc = _escape_id(metadata.template_id)
+        v_esc = _escape_id(metadata.version_str)
+        buf += (
+            "\n  ",
+            m_var,
+            " isa template-metadata, ",
+            self._metadata_block(metadata, tid_esc, v_esc, now),
+            ";\n  ",
+            e_var,
+            " isa template-lifecycle-event, ",
+            self._event_block(
+                tid_esc,
+                v_esc,
+                "registered",
+                metadata.approved_by or "system",  # Auto-approved bootstrap
+                "Initial registration",
+                None,
+                now,
+            ),
+            ";\n  (",
+            m_var,
+            ", ",
+            e_var,
+            ") isa template-has-lifecycle-event;",
+        )
+
     def insert_metadata(self, metadata: TemplateMetadata) -> None:
-        # Check if exists
-        current = self.get_metadata(metadata.template_id, str(metadata.version))
-        if current:
-            logger.info(f"Metadata already exists for {metadata.qualified_id}, skipping insert.")
+        qid = metadata.qualified_id
+        if qid in self._known_qids:
             return
 
-        now = _iso_now()
-
-        # Build insert query with cleaner attribute construction
-        attributes = [
-            f'has template-id "{_escape(metadata.template_id)}"',
-            f'has version "{_escape(str(metadata.version))}"',
-            f'has spec-hash "{_escape(metadata.spec_hash)}"',
-            f'has code-hash "{_escape(metadata.code_hash)}"',
-            f'has status "{_escape(metadata.status.value)}"',
-            f"has frozen {str(metadata.frozen).lower()}",
-            f"has tainted {str(metadata.tainted).lower()}",
-            f"has created-at {now}",
+        # The existence check lives in the write itself: with `match not`, the insert
+        # matches nothing (and is a no-op) when the record already exists.
+        buf = [
+            _INSERT_IF_ABSENT_GUARD.format(
+                tid=_escape_id(metadata.template_id), version=_escape_id(metadata.version_str)
+            ),
+            "insert",
         ]
+        self._emit_insert_metadata(buf, 0, metadata, _iso_now())
+        self._write_query("".join(buf))
 
-        if metadata.deps_hash:
-            attributes.append(f'has deps-hash "{_escape(metadata.deps_hash)}"')
+        self._known_qids.add(qid)
+        logger.info(f"Inserted metadata for {qid} (skipped if already present)")
 
-        attr_block = ",\n                ".join(attributes)
+    def insert_many(self, metadatas: List[TemplateMetadata]) -> None:
+        """
+        Insert metadata records together with their "registered" events.
 
-        query = f"""
-            insert $m isa template-metadata,
-                {attr_block};
+        Records that already exist (or repeat within the batch) are skipped.
+        Each chunk of `BATCH_SIZE` records is written as one multi-entity
+        insert in a single write transaction instead of two commits per record.
         """
+        unknown = [m for m in metadatas if m.qualified_id not in self._known_qids]
+        existing = self.get_metadata_many([(m.template_id, m.version_str) for m in unknown])
+        pending: Dict[str, TemplateMetadata] = {}
+        for metadata in unknown:
+            qid = metadata.qualified_id
+            if qid in pending:
+                continue
+            if (metadata.template_id, metadata.version_str) in existing:
+                logger.info(f"Metadata already exists for {qid}, skipping insert.")
+                continue
+            pending[qid] = metadata
+
+        if not pending:
+            return
 
-        self._write_query(query)
-        logger.info(f"Inserted metadata for {metadata.qualified_id}")
+        batch = list(pending.values())
+        for start in range(0, len(batch), self.BATCH_SIZE):
+            chunk = batch[start : start + self.BATCH_SIZE]
+            now = _iso_now()
+            buf: List[str] = ["insert"]
+            for i, metadata in enumerate(chunk):
+                self._emit_insert_metadata(buf, i, metadata, now)
+            self._write_queries(["".join(buf)], bulk=True)
 
-        # Log registration event
-        try:
-            self.append_event(
-                metadata.template_id,
-                str(metadata.version),
-                "registered",
-                metadata.approved_by or "system",  # Auto-approved bootstrap
-                rationale="Initial registration",
-            )
-        except Exception as e:
-            logger.error(f"Failed to log registration event: {e}")
+            for metadata in chunk:
+                self._known_qids.add(metadata.qualified_id)
+                logger.info(f"Inserted metadata for {metadata.qualified_id}")
 
     def get_metadata(self, template_id: str, version: str) -> Optional[TemplateMetadata]:
         query = f'''
             match $m isa template-metadata,
-                has template-id "{_escape(template_id)}",
-                has version "{_escape(version)}",
-                has spec-hash $spec,
-                has code-hash $code,
-                has status $status,
-                has frozen $frozen,
-                has tainted $tainted;
-            select $spec, $code, $status, $frozen, $tainted;
+                has template-id "{_escape_id(template_id)}",
+                has version "{_escape_id(version)}";
+            fetch {{
+                "spec": $m.spec-hash,
+                "code": $m.code-hash,
+                "status": $m.status,
+                "frozen": $m.frozen,
+                "tainted": $m.tainted
+            }};
         '''
-        results = self._read_query(query)
-        if not results:
-            return None
+        for doc in self._fetch_query(query):
+            # Same contract as the old all-attributes match: incomplete entities are "missing"
+            if all(doc.get(key) is not None for key in _METADATA_FETCH_KEYS):
+                self._known_qids.add(f"{template_id}@{version}")
+                return self._row_to_metadata(template_id, version, doc)
+        return None
+
+    def get_metadata_many(
+        self, keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], TemplateMetadata]:
+        """
+        Fetch metadata for many (template_id, version) keys.
+
+        Uses one read per `BATCH_SIZE` keys (a disjunction over the identity
+        pair) instead of one `get_metadata` round-trip per key. Missing keys
+        are absent from the returned dict.
+        """
+        found: Dict[Tuple[str, str], TemplateMetadata] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), self.BATCH_SIZE):
+            chunk = unique[start : start + self.BATCH_SIZE]
+            branches = " or ".join(
+                f'{{ $tid == "{_escape(tid)}"; $v == "{_escape(v)}"; }}' for tid, v in chunk
+            )
+            query = f"""
+                match $m isa template-metadata,
+                    has template-id $tid,
+                    has version $v,
+                    has spec-hash $spec,
+                    has code-hash $code,
+                    has status $status,
+                    has frozen $frozen,
+                    has tainted $tainted;
+                {branches};
+                select $tid, $v, $spec, $code, $status, $frozen, $tainted;
+            """
+            for row in self._read_query(query, _METADATA_ROW_DECODERS):
+                key = (row.get("tid"), row.get("v"))
+                found.setdefault(key, self._row_to_metadata(key[0], key[1], row))
+        self._known_qids.update(f"{tid}@{v}" for tid, v in found)
+        return found
 
-        row = results[0]
+    @staticmethod
+    def _row_to_metadata(template_id: str, version: str, row: Dict[str, Any]) -> TemplateMetadata:
         # Construct partially populated metadata
         return TemplateMetadata(
             template_id=template_id,
@@ -394,7 +763,40 @@ class TypeDBTemplateStore(TemplateStore):
         - Lifecycle event is inserted in the same write transaction.
         - If already frozen, this becomes a no-op (no duplicate events).
         """
+        # Use a single query containing match/delete/insert so it is atomic.
+        self._write_query(
+            self._freeze_query(template_id, version, evidence_id, claim_id, scope_lock_id, actor)
+        )
+
+        logger.info(
+            f"Freeze attempted for {template_id}@{version} on evidence {evidence_id} (guarded)"
+        )
+
+    def freeze_many(self, freezes: List[Dict[str, Any]]) -> None:
+        """
+        Freeze many templates with one commit per `BATCH_SIZE` freezes.
+
+        Each freeze keeps its own guarded match/delete/insert query, so an
+        already-frozen template stays a no-op without blocking the others.
+        """
+        for start in range(0, len(freezes), self.BATCH_SIZE):
+            chunk = freezes[start : start + self.BATCH_SIZE]
+            self._write_queries([self._freeze_query(**kwargs) for kwargs in chunk], bulk=True)
+        logger.info(f"Freeze attempted for {len(freezes)} templates (guarded)")
+
+    def _freeze_query(
+        self,
+        template_id: str,
+        version: str,
+        evidence_id: str,
+        claim_id: Optional[str] = None,
+        scope_lock_id: Optional[str] = None,
+        actor: str = "system",
+    ) -> str:
+        """Build the guarded freeze + audit-event query."""
         now = _iso_now()
+        tid_esc = _escape_id(template_id)
+        v_esc = _escape_id(version)
         # Deterministic event ID for idempotency
         evt_id = _make_template_event_id(template_id, version, "frozen", evidence_id)
 
@@ -403,20 +805,41 @@ class TypeDBTemplateStore(TemplateStore):
             "claim_id": claim_id,
             "scope_lock_id": scope_lock_id,
         }
-        json_str = json.dumps(extra_json, sort_keys=True)
-
-        from typedb.driver import TransactionType
+        attr_block = _FREEZE_ATTRS_TEMPLATE.format_map(
+            {
+                "now": now,
+                "evidence": _escape(evidence_id),
+                "claim_tail": (
+                    _CLAIM_TAIL_TEMPLATE.format(claim=_escape(claim_id)) if claim_id else ""
+                ),
+                "scope_tail": (
+                    _SCOPE_TAIL_TEMPLATE.format(scope=_escape(scope_lock_id))
+                    if scope_lock_id
+                    else ""
+                ),
+            }
+        )
+        event_block = self._event_block(
+            tid_esc,
+            v_esc,
+            "frozen",
+            actor,
+            _escape(f"Frozen on first evidence {evidence_id}"),
+            extra_json,
+            now,
+            evt_id=evt_id,
+        )
 
         # NOTE: This relies on the invariant that template-metadata always has an explicit
         # frozen attribute at creation time (insert_metadata sets has frozen false).
         # Therefore, "match has frozen false" is a complete guard.
 
         # Single atomic query for mutation + audit
-        query = f'''
+        return f'''
             match
               $m isa template-metadata,
-                 has template-id "{_escape(template_id)}",
-                 has version "{_escape(version)}",
+                 has template-id "{tid_esc}",
+                 has version "{v_esc}",
                  has frozen $frozen;
               $frozen == false;
 
@@ -424,35 +847,14 @@ class TypeDBTemplateStore(TemplateStore):
               has $frozen of $m;
 
             insert
-              $m has frozen true,
-                 has frozen-at {now},
-                 has first-evidence-id "{_escape(evidence_id)}"
-                 {"," if claim_id else ""}{f' has freeze-claim-id "{_escape(claim_id)}"' if claim_id else ""}
-                 {"," if scope_lock_id else ""}{f' has freeze-scope-lock-id "{_escape(scope_lock_id)}"' if scope_lock_id else ""};
+              $m {attr_block};
 
               $e isa template-lifecycle-event,
-                 has entity-id "{evt_id}",
-                 has template-id "{_escape(template_id)}",
-                 has version "{_escape(version)}",
-                 has event-type "frozen",
-                 has actor "{_escape(actor)}",
-                 has rationale "{_escape(f"Frozen on first evidence {evidence_id}")}",
-                 has json "{_escape(json_str)}",
-                 has created-at {now};
+                 {event_block};
 
               ($m, $e) isa template-has-lifecycle-event;
         '''
 
-        # Execute in transaction
-        with self.driver.transaction(self.database, TransactionType.WRITE) as tx:
-            # Use a single query containing match/delete/insert so it is atomic.
-            self._exec_query(tx, query)
-            tx.commit()
-
-        logger.info(
-            f"Freeze attempted for {template_id}@{version} on evidence {evidence_id} (guarded)"
-        )
-
     def taint(
         self,
         template_id: str,
@@ -462,48 +864,49 @@ class TypeDBTemplateStore(TemplateStore):
         actor: str = "system",
     ) -> None:
         now = _iso_now()
+        tid_esc = _escape_id(template_id)
+        v_esc = _escape_id(version)
+        reason_esc = _escape(reason)
+
+        superseded_tail = (
+            _SUPERSEDED_TAIL_TEMPLATE.format(superseded=_escape(superseded_by))
+            if superseded_by
+            else ""
+        )
+        attr_block = _TAINT_ATTRS_TEMPLATE.format_map(
+            {"now": now, "reason": reason_esc, "superseded_tail": superseded_tail}
+        )
+        event_block = self._event_block(
+            tid_esc,
+            v_esc,
+            "tainted",
+            actor,
+            reason_esc,
+            {"superseded_by": superseded_by},
+            now,
+        )
 
-        delete_query = f'''
-            match $m isa template-metadata,
-                has template-id "{_escape(template_id)}",
-                has version "{_escape(version)}",
-                has tainted $old;
-            delete has $old of $m;
-        '''
+        # Single match/delete/insert pipeline: one plan, one match of the entity,
+        # with the audit event written by the same query.
+        query = f'''
+            match
+              $m isa template-metadata,
+                 has template-id "{tid_esc}",
+                 has version "{v_esc}",
+                 has tainted $old;
 
-        insert_attrs = [
-            "has tainted true",
-            f"has tainted-at {now}",
-            f'has tainted-reason "{_escape(reason)}"',
-        ]
-        if superseded_by:
-            insert_attrs.append(f'has superseded-by "{_escape(superseded_by)}"')
+            delete
+              has $old of $m;
 
-        attr_block = ",\n                ".join(insert_attrs)
+            insert
+              $m {attr_block};
 
-        insert_query = f'''
-            match $m isa template-metadata,
-                has template-id "{_escape(template_id)}",
-                has version "{_escape(version)}";
-            insert $m 
-                {attr_block};
-        '''
+              $e isa template-lifecycle-event,
+                 {event_block};
 
-        from typedb.driver import TransactionType
+              ($m, $e) isa template-has-lifecycle-event;
+        '''
 
-        with self.driver.transaction(self.database, TransactionType.WRITE) as tx:
-            self._exec_query(tx, delete_query)
-            self._exec_query(tx, insert_query)
-            tx.commit()
+        self._write_query(query)
 
         logger.info(f"TAINTED template {template_id}@{version}: {reason}")
-
-        # Log event
-        self.append_event(
-            template_id,
-            version,
-            "tainted",
-            actor,
-            rationale=reason,
-            extra_json={"superseded_by": superseded_by},
-        )
@@ -13,7 +13,8 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Type
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
@@ -197,13 +198,24 @@ class CodeActOutput(BaseModel):
 # =============================================================================
 
 
+# Same output as json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+@lru_cache(maxsize=2048)
+def _seed_from_context(session_id: str, claim_id: str, template_id: str) -> int:
+    """Deterministic 31-bit seed for a (session, claim, template) context."""
+    hash_input = f"{session_id}:{claim_id}:{template_id}"
+    return int(hashlib.sha256(hash_input.encode()).hexdigest()[:8], 16) % (2**31)
+
+
 def sha256_json(data: Any) -> str:
     """
     Stable hash of JSON-serializable data.
     separators removes whitespace differences; sort_keys enforces stable key order.
     """
     try:
-        s = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        s = _HASH_ENCODER.encode(data)
         return hashlib.sha256(s.encode("utf-8")).hexdigest()
     except Exception:
         return "hash-error"
@@ -224,14 +236,17 @@ class Template(ABC):
         """Validate parameters against schema."""
         return self.ParamModel.model_validate(params)
 
+    def validate_json(self, raw: Union[str, bytes]) -> BaseModel:
+        """Validate raw JSON parameters without building an intermediate dict."""
+        return self.ParamModel.model_validate_json(raw)
+
     def get_seed(self, params: BaseModel, session_id: str = "", claim_id: str = "") -> int:
         """Get deterministic seed for reproducibility."""
         seed = getattr(params, "seed", None)
         if seed is not None:
             return seed
         # Deterministic seed from context
-        hash_input = f"{session_id}:{claim_id}:{self.template_id}"
-        return int(hashlib.sha256(hash_input.encode()).hexdigest()[:8], 16) % (2**31)
+        return _seed_from_context(session_id, claim_id, self.template_id)
 
     @abstractmethod
     def run(self, params: BaseModel, context: Optional[Dict] = None) -> Dict[str, Any]:
@@ -244,6 +259,28 @@ class Template(ABC):
 # =============================================================================
 
 
+# Upper bound on resample indices materialised at once (~32 MiB of int64)
+_BOOTSTRAP_BATCH_ELEMENTS = 1 << 22
+
+
+def _bootstrap_means(data: np.ndarray, n_bootstrap: int, rng: np.random.RandomState) -> np.ndarray:
+    """
+    Means of `n_bootstrap` with-replacement resamples of `data`, drawn in batches.
+
+    `rng.randint` consumes the legacy stream in the same order as one
+    `np.random.choice(data, size=n)` per resample, so results match the
+    original per-resample loop for the same seed.
+    """
+    n = data.shape[0]
+    means = np.empty(n_bootstrap, dtype=np.float64)
+    batch = max(1, _BOOTSTRAP_BATCH_ELEMENTS // n)
+    for start in range(0, n_bootstrap, batch):
+        stop = min(start + batch, n_bootstrap)
+        idx = rng.randint(0, n, size=(stop - start, n))
+        means[start:stop] = data[idx].mean(axis=1)
+    return means
+
+
 class BootstrapCITemplate(Template):
     template_id = "bootstrap_ci"
     description = "Estimate effect with confidence interval via bootstrap"
@@ -253,24 +290,18 @@ class BootstrapCITemplate(Template):
     def run(self, params: BootstrapCIParams, context: Optional[Dict] = None) -> Dict[str, Any]:
         context = context or {}
         seed = self.get_seed(params, context.get("session_id", ""), context.get("claim_id", ""))
-        np.random.seed(seed)
+        rng = np.random.RandomState(seed)
 
-        data = np.array(params.data)
-        n = len(data)
-
-        bootstrap_means = []
-        for _ in range(params.n_bootstrap):
-            sample = np.random.choice(data, size=n, replace=True)
-            bootstrap_means.append(np.mean(sample))
-
-        bootstrap_means = np.array(bootstrap_means)
+        data = np.asarray(params.data, dtype=np.float64)
+        bootstrap_means = _bootstrap_means(data, params.n_bootstrap, rng)
         alpha = 1 - params.confidence_level
+        ci_low, ci_high = np.percentile(bootstrap_means, [100 * alpha / 2, 100 * (1 - alpha / 2)])
 
         return {
             "method": "bootstrap_ci",
             "estimate": float(np.mean(bootstrap_means)),
-            "ci_low": float(np.percentile(bootstrap_means, 100 * alpha / 2)),
-            "ci_high": float(np.percentile(bootstrap_means, 100 * (1 - alpha / 2))),
+            "ci_low": float(ci_low),
+            "ci_high": float(ci_high),
             "variance": float(np.var(bootstrap_means)),
             "n_samples": params.n_bootstrap,
             "seed": seed,
@@ -286,9 +317,9 @@ class BayesianUpdateTemplate(Template):
     def run(self, params: BayesianUpdateParams, context: Optional[Dict] = None) -> Dict[str, Any]:
         context = context or {}
         seed = self.get_seed(params, context.get("session_id", ""), context.get("claim_id", ""))
-        np.random.seed(seed)
+        rng = np.random.RandomState(seed)
 
-        observations = np.array(params.observations)
+        observations = np.asarray(params.observations, dtype=np.float64)
         n_obs = len(observations)
         obs_mean = np.mean(observations)
 
@@ -301,14 +332,15 @@ class BayesianUpdateTemplate(Template):
         )
         posterior_std = np.sqrt(posterior_var)
 
-        samples = np.random.normal(posterior_mean, posterior_std, params.n_samples)
+        samples = rng.normal(posterior_mean, posterior_std, params.n_samples)
+        ci_low, ci_high = np.quantile(samples, [0.025, 0.975])
 
         return {
             "method": "bayesian_update",
             "posterior_mean": float(posterior_mean),
             "posterior_std": float(posterior_std),
-            "ci_low": float(np.percentile(samples, 2.5)),
-            "ci_high": float(np.percentile(samples, 97.5)),
+            "ci_low": float(ci_low),
+            "ci_high": float(ci_high),
             "n_samples": params.n_samples,
             "seed": seed,
         }
@@ -323,7 +355,7 @@ class ThresholdCheckTemplate(Template):
 
     def run(self, params: ThresholdCheckParams, context: Optional[Dict] = None) -> Dict[str, Any]:
         context = context or {}
-        values = np.array(params.values)
+        values = np.asarray(params.values, dtype=np.float64)
         mean_val = float(np.mean(values))
 
         if params.direction == "above":
@@ -354,7 +386,7 @@ class NumericConsistencyTemplate(Template):
         self, params: NumericConsistencyParams, context: Optional[Dict] = None
     ) -> Dict[str, Any]:
         context = context or {}
-        observed = np.array(params.observed_values)
+        observed = np.asarray(params.observed_values, dtype=np.float64)
         observed_mean = float(np.mean(observed))
         deviation = abs(params.claimed_value - observed_mean)
 
@@ -377,19 +409,17 @@ class SensitivitySuiteTemplate(Template):
     def run(self, params: SensitivitySuiteParams, context: Optional[Dict] = None) -> Dict[str, Any]:
         context = context or {}
         seed = self.get_seed(params, context.get("session_id", ""), context.get("claim_id", ""))
-        np.random.seed(seed)
+        # RandomState.normal(size=n) yields the same draws as n scalar
+        # np.random.normal calls after np.random.seed(seed).
+        rng = np.random.RandomState(seed)
 
-        flip_count = 0
         base_supports = params.base_ci_low > 0 or params.base_ci_high < 0
+        half_width = (params.base_ci_high - params.base_ci_low) * params.prior_widening_factor / 2
 
-        for _ in range(params.n_perturbations):
-            noise = np.random.normal(0, params.prior_widening_factor * 0.1)
-            perturbed = params.base_result + noise
-            width = (params.base_ci_high - params.base_ci_low) * params.prior_widening_factor
-            perturbed_supports = (perturbed - width / 2) > 0 or (perturbed + width / 2) < 0
-
-            if base_supports != perturbed_supports:
-                flip_count += 1
+        noise = rng.normal(0, params.prior_widening_factor * 0.1, params.n_perturbations)
+        perturbed = params.base_result + noise
+        perturbed_supports = ((perturbed - half_width) > 0) | ((perturbed + half_width) < 0)
+        flip_count = int(np.count_nonzero(perturbed_supports != base_supports))
 
         flip_rate = flip_count / params.n_perturbations
 
@@ -414,21 +444,23 @@ class ContradictionDetectTemplate(Template):
         self, params: ContradictionDetectParams, context: Optional[Dict] = None
     ) -> Dict[str, Any]:
         context = context or {}
-        contradictions = []
-
-        # Find evidence items that conflict
-        supporting = [e for e in params.evidence_items if e.get("supports_claim", False)]
-        refuting = [e for e in params.evidence_items if not e.get("supports_claim", True)]
-
-        for s in supporting:
-            for r in refuting:
-                contradictions.append(
-                    {
-                        "supporting_id": s.get("id", "unknown"),
-                        "refuting_id": r.get("id", "unknown"),
-                        "claim_id": params.claim_id,
-                    }
-                )
+        claim_id = params.claim_id
+
+        # Find evidence items that conflict; ids are resolved once per item, not per pair
+        supporting_ids = [
+            e.get("id", "unknown") for e in params.evidence_items if e.get("supports_claim", False)
+        ]
+        refuting_ids = [
+            e.get("id", "unknown")
+            for e in params.evidence_items
+            if not e.get("supports_claim", True)
+        ]
+
+        contradictions = [
+            {"supporting_id": s_id, "refuting_id": r_id, "claim_id": claim_id}
+            for s_id in supporting_ids
+            for r_id in refuting_ids
+        ]
 
         return {
             "method": "contradiction_detect",
@@ -447,22 +479,23 @@ class CitationCheckTemplate(Template):
 
     def run(self, params: CitationCheckParams, context: Optional[Dict] = None) -> Dict[str, Any]:
         context = context or {}
+        claim_id = params.claim_id
         sources = []
+        citation_count = 0
 
         for item in params.evidence_bundle:
-            if (
-                item.get("claim_id") == params.claim_id
-                or item.get("hypothesis_id") == params.claim_id
-            ):
-                source = item.get("source", item.get("source_id", ""))
+            if item.get("claim_id") == claim_id or item.get("hypothesis_id") == claim_id:
+                source = item["source"] if "source" in item else item.get("source_id", "")
                 if source:
-                    sources.append(source)
+                    citation_count += 1
+                    if citation_count <= 10:  # Limit output size
+                        sources.append(source)
 
         return {
             "method": "citation_check",
-            "has_citations": len(sources) > 0,
-            "citation_count": len(sources),
-            "sources": sources[:10],  # Limit output size
+            "has_citations": citation_count > 0,
+            "citation_count": citation_count,
+            "sources": sources,
         }
 
 
@@ -475,9 +508,14 @@ class EffectDirectionTemplate(Template):
 
     def run(self, params: EffectDirectionParams, context: Optional[Dict] = None) -> Dict[str, Any]:
         context = context or {}
-        values = np.array(params.observations)
-        mean_val = float(np.mean(values))
-        std_val = float(np.std(values)) if len(values) > 1 else 0.0
+        values = np.asarray(params.observations, dtype=np.float64)
+        mean = values.mean()
+        mean_val = float(mean)
+        # Population std from the mean already computed (np.std would recompute it)
+        deviations = values - mean
+        std_val = (
+            float(np.sqrt(deviations.dot(deviations) / values.size)) if values.size > 1 else 0.0
+        )
 
         # Determine actual direction
         if std_val > 0 and abs(mean_val) > std_val:
@@ -521,7 +559,7 @@ class CodeActTemplate(Template):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateExecution:
     """Record of a template execution for auditing."""
 
@@ -563,11 +601,12 @@ class TemplateRegistry:
 
     def get(self, template_id: str) -> Template:
         """Get a template by ID."""
-        if template_id not in self._templates:
+        template = self._templates.get(template_id)
+        if template is None:
             raise KeyError(
                 f"Unknown template: {template_id}. Available: {list(self._templates.keys())}"
             )
-        return self._templates[template_id]
+        return template
 
     def list_templates(self) -> List[Dict[str, str]]:
         """List available templates."""
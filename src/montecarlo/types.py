@@ -8,6 +8,9 @@ from pydantic import BaseModel, Field, model_validator
 
 logger = logging.getLogger(__name__)
 
+# Same output as json.dumps(..., sort_keys=True), without rebuilding an encoder per digest
+_DIGEST_ENCODER = json.JSONEncoder(sort_keys=True)
+
 # Constitutional Constants
 QID_RE = re.compile(r"^[a-z0-9_]+@\d+\.\d+\.\d+$")
 
@@ -93,12 +96,10 @@ class ExperimentHints(BaseModel):
             "candidate_mechanisms": sorted(self.candidate_mechanisms),
             "discriminative_predictions": sorted(self.discriminative_predictions),
             "sensitivity_axes": sorted(self.sensitivity_axes),
-            "prior_suggestions": sorted(
-                [f"{p.domain}:{p.parallel}" for p in self.prior_suggestions]
-            ),
+            "prior_suggestions": sorted(f"{p.domain}:{p.parallel}" for p in self.prior_suggestions),
             "falsification_criteria": sorted(self.falsification_criteria),
         }
-        s = json.dumps(data, sort_keys=True)
+        s = _DIGEST_ENCODER.encode(data)
         return hashlib.sha256(s.encode()).hexdigest()[:16]
 
 
@@ -107,15 +108,81 @@ class ExperimentHints(BaseModel):
 # =============================================================================
 
 # Fields that indicate speculative residue - must NEVER appear in ExperimentSpec
-SPECULATIVE_RESIDUE_FIELDS = {
-    "lane",  # Primary sentinel marker
-    "experiment_hints",
-    "speculative_context",
-    "epistemic_status",
-    "alternatives",
-    "analogies",
-    "edge_cases",
-}
+SPECULATIVE_RESIDUE_FIELDS = frozenset(
+    {
+        "lane",  # Primary sentinel marker
+        "experiment_hints",
+        "speculative_context",
+        "epistemic_status",
+        "alternatives",
+        "analogies",
+        "edge_cases",
+    }
+)
+
+# Every residue field as it appears in JSON when used as a key
+_RESIDUE_MARKERS = tuple(f'"{field}"' for field in SPECULATIVE_RESIDUE_FIELDS)
+_RESIDUE_SCAN_ENCODER = json.JSONEncoder(default=str)
+
+# ExperimentSpec fields that accept nested, caller-shaped data
+_FREE_FORM_FIELDS = frozenset({"params", "units", "assumptions", "analytic_sanity"})
+
+
+def _may_contain_residue(obj: Any) -> bool:
+    """
+    Cheap pre-scan: False only if no residue field name occurs anywhere in `obj`.
+
+    Encodes once in C and searches the text, so clean payloads skip the
+    recursive walk; any hit (or an unencodable payload) defers to the walk.
+    """
+    try:
+        text = _RESIDUE_SCAN_ENCODER.encode(obj)
+    except (TypeError, ValueError):
+        return True
+    return any(marker in text for marker in _RESIDUE_MARKERS)
+
+
+def _format_residue_path(path: Tuple[Any, ...]) -> str:
+    # Dict keys are stored bare, list indices as 1-tuples
+    out = ""
+    for step in path:
+        if isinstance(step, tuple):
+            out += f"[{step[0]}]"
+        else:
+            out = f"{out}.{step}" if out else str(step)
+    return out
+
+
+def _find_speculative_residue(data: Any, path: Tuple[Any, ...] = ()) -> Optional[str]:
+    """
+    Depth-first search for speculative residue in nested dicts/lists.
+
+    Iterative, and only containers are pushed; the path is formatted only
+    for the violation that is returned.
+    """
+    stack: List[Tuple[Any, Tuple[Any, ...]]] = [(data, path)]
+    while stack:
+        obj, path = stack.pop()
+        if isinstance(obj, dict):
+            if obj.get("epistemic_status") == "speculative":
+                return f"{_format_residue_path(path)} contains epistemic_status='speculative'"
+            hit = obj.keys() & SPECULATIVE_RESIDUE_FIELDS
+            if hit:
+                return _format_residue_path(path + (next(iter(hit)),))
+            children = [
+                (value, path + (key,))
+                for key, value in obj.items()
+                if isinstance(value, (dict, list))
+            ]
+        else:
+            children = [
+                (item, path + ((i,),))
+                for i, item in enumerate(obj)
+                if isinstance(item, (dict, list))
+            ]
+        # Reversed so the first child is visited first, as in a recursive walk
+        stack.extend(reversed(children))
+    return None
 
 
 class ExperimentSpec(BaseModel):
@@ -162,33 +229,24 @@ class ExperimentSpec(BaseModel):
         # ---------------------------------------------------------
         # 1. Speculative Residue Check (Fail Fast)
         # ---------------------------------------------------------
-        def contains_speculative(obj: Any, path: str = "") -> Optional[str]:
-            if isinstance(obj, dict):
-                if obj.get("epistemic_status") == "speculative":
-                    return f"{path} contains epistemic_status='speculative'"
-                for field in SPECULATIVE_RESIDUE_FIELDS:
-                    if field in obj:
-                        return f"{path}.{field}" if path else field
-                for key, value in obj.items():
-                    result = contains_speculative(value, f"{path}.{key}" if path else key)
-                    if result:
-                        return result
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    result = contains_speculative(item, f"{path}[{i}]")
-                    if result:
-                        return result
-            return None
-
         # Top-level check
-        for field in SPECULATIVE_RESIDUE_FIELDS:
-            if field in data:
-                raise ValueError(f"INVARIANT VIOLATION: ExperimentSpec cannot contain '{field}'.")
-
-        # Recursive check
-        violation = contains_speculative(data)
-        if violation:
-            raise ValueError(f"INVARIANT VIOLATION: Speculative content found at '{violation}'.")
+        hit = data.keys() & SPECULATIVE_RESIDUE_FIELDS
+        if hit:
+            field = next(iter(hit))
+            raise ValueError(f"INVARIANT VIOLATION: ExperimentSpec cannot contain '{field}'.")
+
+        # Recursive check of the free-form subtrees; every other field is a typed
+        # scalar, and unknown top-level keys are rejected by extra="forbid".
+        for name, subtree in data.items():
+            if name not in _FREE_FORM_FIELDS or not isinstance(subtree, (dict, list)):
+                continue
+            if not _may_contain_residue(subtree):
+                continue
+            violation = _find_speculative_residue(subtree, (name,))
+            if violation:
+                raise ValueError(
+                    f"INVARIANT VIOLATION: Speculative content found at '{violation}'."
+                )
 
         # ---------------------------------------------------------
         # 2. Hygiene & Normalization
@@ -207,8 +265,9 @@ class ExperimentSpec(BaseModel):
 
         # Normalize Legacy ID -> QID
         if not qid:
-            if tid and tid in LEGACY_TEMPLATE_TO_QID:
-                qid = LEGACY_TEMPLATE_TO_QID[tid]
+            mapped = LEGACY_TEMPLATE_TO_QID.get(tid) if tid else None
+            if mapped is not None:
+                qid = mapped
                 logger.warning(
                     f"LEGACY_TEMPLATE_ID_USED: Mapped '{tid}' to '{qid}'. Update generator!"
                 )
@@ -232,7 +291,7 @@ class ExperimentSpec(BaseModel):
                 f"Missing or invalid template_qid. Legacy id '{tid}' not in pinned map."
             )
 
-        if not QID_RE.match(qid):
+        if not QID_RE.fullmatch(qid):
             raise ValueError(f"Invalid template_qid format: {qid} (expected name@X.Y.Z)")
 
         # B. Scope Lock
@@ -278,8 +278,7 @@ def build_versioned_registry() -> VersionedTemplateRegistry:
         (CodeActTemplate(), CODEACT_V1_SPEC),
     ]
 
-    for template, spec in templates_specs:
-        registry.register(template, spec)
+    registry.register_many(templates_specs)
 
     return registry
 
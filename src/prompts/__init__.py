@@ -1,10 +1,12 @@
 """SuperHyperion Prompts"""
 
+from functools import lru_cache
 from pathlib import Path
 
 PROMPTS_DIR = Path(__file__).parent
 
 
+@lru_cache(maxsize=32)
 def load_prompt(name: str) -> str:
     """Load a prompt template by name."""
     path = PROMPTS_DIR / f"{name}.txt"
@@ -13,9 +15,20 @@ def load_prompt(name: str) -> str:
     raise FileNotFoundError(f"Prompt not found: {name}")
 
 
-# Pre-load common prompts
-CODEACT_SYSTEM = load_prompt("codeact_system")
-SOCRATIC_CRITIC = load_prompt("socratic_critic")
+# Common prompts, read from disk on first access rather than at import
+_LAZY_PROMPTS = {
+    "CODEACT_SYSTEM": "codeact_system",
+    "SOCRATIC_CRITIC": "socratic_critic",
+}
+
+
+def __getattr__(name: str) -> str:
+    prompt = _LAZY_PROMPTS.get(name)
+    if prompt is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = load_prompt(prompt)
+    return value
+
 
 __all__ = [
     "load_prompt",
@@ -1,4 +1,11 @@
 from pathlib import Path
 
 SCHEMA_PATH = Path(__file__).parent / "scientific_knowledge.tql"
-CANONICAL_SCHEMA = SCHEMA_PATH.read_text(encoding="utf-8")
+
+
+def __getattr__(name: str) -> str:
+    # CANONICAL_SCHEMA is read on first access rather than at import
+    if name == "CANONICAL_SCHEMA":
+        value = globals()[name] = SCHEMA_PATH.read_text(encoding="utf-8")
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import quote
 
 from src.graph.contracts import GovernanceSummaryV1
@@ -66,33 +66,45 @@ def output_prefix(bundle: BundleView) -> str:
     return quote(normalized, safe="")
 
 
+# Governance payload (source_refs stripped) and raw manifest, as parsed during discovery
+_Preparsed = Tuple[Dict[str, Any], Optional[Dict[str, Any]]]
+
+_BUNDLE_SUFFIXES = (
+    ("_governance_summary.json", "governance"),
+    ("_replay_verify_verdict.json", "replay"),
+    ("_run_capsule_manifest.json", "manifest"),
+    ("_explainability_summary.json", "explainability"),
+)
+
+
 def discover_bundle_paths(
     bundles_dir: str, tenant_id: Optional[str] = None
 ) -> Dict[str, BundlePaths]:
+    return _discover_bundles(bundles_dir, tenant_id)[0]
+
+
+def _discover_bundles(
+    bundles_dir: str, tenant_id: Optional[str]
+) -> Tuple[Dict[str, BundlePaths], Dict[str, _Preparsed]]:
+    """
+    Discover bundle paths, plus the governance/manifest payloads that tenant
+    filtering already parsed (keyed like the paths) so loading can reuse them.
+    """
+    preparsed: Dict[str, _Preparsed] = {}
     grouped: Dict[str, Dict[str, str]] = {}
-    files: list[str] = []
-    for root, dirs, filenames in os.walk(bundles_dir):
-        dirs.sort()
-        for name in sorted(filenames):
-            if name.endswith(".json"):
-                files.append(os.path.join(root, name))
-
-    suffixes = {
-        "_governance_summary.json": "governance",
-        "_replay_verify_verdict.json": "replay",
-        "_run_capsule_manifest.json": "manifest",
-        "_explainability_summary.json": "explainability",
-    }
-    for path in files:
-        name = os.path.basename(path)
-        rel_dir = os.path.relpath(os.path.dirname(path), bundles_dir)
-        rel_dir = rel_dir.replace("\\", "/")
-        for suffix, key in suffixes.items():
-            if name.endswith(suffix):
-                prefix = name[: -len(suffix)]
-                bundle_key = prefix if rel_dir == "." else f"{rel_dir}/{prefix}"
-                grouped.setdefault(bundle_key, {"prefix": prefix})[key] = path
-                break
+    # Bundles are keyed and emitted in sorted order, so walk order does not matter
+    for root, _dirs, filenames in os.walk(bundles_dir):
+        rel_dir = os.path.relpath(root, bundles_dir).replace("\\", "/")
+        key_prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        for name in filenames:
+            if not name.endswith(".json"):
+                continue
+            for suffix, key in _BUNDLE_SUFFIXES:
+                if name.endswith(suffix):
+                    prefix = name[: -len(suffix)]
+                    entry = grouped.setdefault(key_prefix + prefix, {"prefix": prefix})
+                    entry[key] = os.path.join(root, name)
+                    break
 
     result: Dict[str, BundlePaths] = {}
     for bundle_key in sorted(grouped):
@@ -105,6 +117,7 @@ def discover_bundle_paths(
             bundle_tenant = _bundle_tenant_id(governance, manifest)
             if _effective_tenant_id(bundle_tenant) != tenant_id:
                 continue
+            preparsed[bundle_key] = (governance, manifest)
         result[bundle_key] = BundlePaths(
             prefix=str(item["prefix"]),
             governance=item["governance"],
@@ -112,16 +125,21 @@ def discover_bundle_paths(
             manifest=item.get("manifest"),
             explainability=item.get("explainability"),
         )
-    return result
+    return result, preparsed
 
 
-def load_bundle_view(paths: BundlePaths, bundle_key: str) -> BundleView:
-    gov_payload = _strip_source_refs(_read_json(paths.governance))
+def load_bundle_view(
+    paths: BundlePaths, bundle_key: str, preparsed: Optional[_Preparsed] = None
+) -> BundleView:
+    if preparsed is not None:
+        gov_payload, manifest = preparsed
+    else:
+        gov_payload = _strip_source_refs(_read_json(paths.governance))
+        manifest = _read_json(paths.manifest) if paths.manifest else None
     gov = GovernanceSummaryV1(**gov_payload)
     replay = (
         ReplayVerdictV1(**_strip_source_refs(_read_json(paths.replay))) if paths.replay else None
     )
-    manifest = _read_json(paths.manifest) if paths.manifest else None
     explainability = (
         parse_explainability_summary(_read_json(paths.explainability))
         if paths.explainability
@@ -144,9 +162,9 @@ def load_bundle_view(paths: BundlePaths, bundle_key: str) -> BundleView:
 
 
 def load_bundles(bundles_dir: str, tenant_id: Optional[str] = None) -> list[BundleView]:
-    bundle_paths = discover_bundle_paths(bundles_dir, tenant_id=tenant_id)
+    bundle_paths, preparsed = _discover_bundles(bundles_dir, tenant_id)
     bundles = [
-        load_bundle_view(bundle_paths[bundle_key], bundle_key)
+        load_bundle_view(bundle_paths[bundle_key], bundle_key, preparsed.get(bundle_key))
         for bundle_key in sorted(bundle_paths)
     ]
     bundles.sort(key=lambda b: (b.effective_tenant_id, (b.capsule_id or ""), b.bundle_key))
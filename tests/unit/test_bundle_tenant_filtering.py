@@ -79,6 +79,35 @@ def test_tenant_default_filter_includes_legacy_missing_tenant(tmp_path):
     assert [b.prefix for b in acme_loaded] == ["run-acme"]
 
 
+def test_tenant_filtered_load_parses_governance_and_manifest_once(tmp_path, monkeypatch):
+    import src.sdk.bundles as bundles_mod
+
+    bundles = tmp_path / "bundles"
+    bundles.mkdir()
+    _bundle(bundles, "run-a", "tenant-a")
+    _bundle(bundles, "run-b", "tenant-b")
+
+    reads: list[str] = []
+    real_read_json = bundles_mod._read_json
+
+    def counting_read_json(path):
+        reads.append(Path(path).name)
+        return real_read_json(path)
+
+    monkeypatch.setattr(bundles_mod, "_read_json", counting_read_json)
+
+    loaded = load_bundles(str(bundles), tenant_id="tenant-a")
+    assert [b.prefix for b in loaded] == ["run-a"]
+    assert loaded[0].effective_tenant_id == "tenant-a"
+    assert loaded[0].capsule_id == "run-a"
+    assert sorted(reads) == [
+        "run-a_governance_summary.json",
+        "run-a_run_capsule_manifest.json",
+        "run-b_governance_summary.json",
+        "run-b_run_capsule_manifest.json",
+    ]
+
+
 def test_nested_duplicate_prefixes_preserve_directory_context(tmp_path):
     bundles = tmp_path / "bundles"
     out = tmp_path / "policy"
@@ -0,0 +1,189 @@
+import hashlib
+import json
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.montecarlo.templates import BootstrapCIParams, BootstrapCITemplate, sha256_json
+
+
+def test_get_seed_from_context_is_stable_and_memoized():
+    template = BootstrapCITemplate()
+    params = BootstrapCIParams(data=[1.0, 2.0])
+    expected = int(hashlib.sha256(b"sess:claim:bootstrap_ci").hexdigest()[:8], 16) % (2**31)
+
+    assert template.get_seed(params, "sess", "claim") == expected
+    assert template.get_seed(params, "sess", "claim") == expected
+
+
+def test_get_seed_prefers_explicit_param_seed():
+    params = BootstrapCIParams(data=[1.0, 2.0], seed=7)
+
+    assert BootstrapCITemplate().get_seed(params, "sess", "claim") == 7
+
+
+def test_list_params_store_lists_and_compare_equal():
+    params = BootstrapCIParams(data=[1, 2, 3])
+
+    assert params.data == [1.0, 2.0, 3.0]
+    assert params == BootstrapCIParams(data=[1, 2, 3])
+    with pytest.raises(ValidationError):
+        BootstrapCIParams(data=[1.0])
+
+
+def test_list_params_keep_list_json_schema():
+    schema = BootstrapCIParams.model_json_schema()["properties"]["data"]
+
+    assert schema == {
+        "items": {"type": "number"},
+        "maxItems": 5000,
+        "minItems": 2,
+        "title": "Data",
+        "type": "array",
+    }
+
+
+def test_sha256_json_is_compact_sorted_utf8():
+    data = {"b": [1.5, "é", None, True], "a": 1e-05}
+    compact = '{"a":1e-05,"b":[1.5,"é",null,true]}'
+
+    assert sha256_json(data) == hashlib.sha256(compact.encode("utf-8")).hexdigest()
+    assert sha256_json({"x": object()}) == "hash-error"
+
+
+def test_validate_json_matches_dict_validation():
+    template = BootstrapCITemplate()
+    raw = '{"data": [1, 2, 3], "n_bootstrap": 100, "seed": 7}'
+
+    from_json = template.validate_json(raw)
+
+    assert from_json.model_dump() == template.validate(json.loads(raw)).model_dump()
+    with pytest.raises(ValidationError):
+        template.validate_json('{"data": "nope"}')
+
+
+def test_bootstrap_means_are_seeded_and_batch_size_independent(monkeypatch):
+    from src.montecarlo import templates
+
+    data = np.arange(10, dtype=np.float64)
+    full = templates._bootstrap_means(data, 300, np.random.RandomState(7))
+    monkeypatch.setattr(templates, "_BOOTSTRAP_BATCH_ELEMENTS", 25)
+    batched = templates._bootstrap_means(data, 300, np.random.RandomState(7))
+
+    np.testing.assert_array_equal(full, batched)
+    assert full.shape == (300,) and 0.0 <= full.min() <= full.max() <= 9.0
+
+
+def test_bootstrap_means_match_the_per_resample_loop():
+    from src.montecarlo import templates
+
+    data = np.array([0.5, -1.25, 3.0, 7.5, 2.0])
+    legacy = np.random.RandomState(11)
+    expected = [np.mean(legacy.choice(data, size=5, replace=True)) for _ in range(200)]
+
+    np.testing.assert_array_equal(
+        templates._bootstrap_means(data, 200, np.random.RandomState(11)), expected
+    )
+
+
+def test_bootstrap_ci_run_is_reproducible_for_a_seed():
+    template = BootstrapCITemplate()
+    params = BootstrapCIParams(data=[1.0, 2.0, 3.0, 4.0], n_bootstrap=500, seed=3)
+
+    first = template.run(params)
+
+    assert first == template.run(params)
+    assert first["ci_low"] <= first["estimate"] <= first["ci_high"]
+
+
+def test_sensitivity_suite_flip_rate_is_seeded_and_bounded():
+    from src.montecarlo.templates import SensitivitySuiteParams, SensitivitySuiteTemplate
+
+    template = SensitivitySuiteTemplate()
+    stable = SensitivitySuiteParams(base_result=5.0, base_ci_low=4.9, base_ci_high=5.1, seed=1)
+    edge = SensitivitySuiteParams(base_result=0.0, base_ci_low=-0.1, base_ci_high=0.1, seed=1)
+
+    assert template.run(stable)["flip_rate"] == 0.0
+    result = template.run(edge)
+    assert result == template.run(edge)
+    assert 0.0 <= result["flip_rate"] <= 1.0
+
+
+def test_sensitivity_suite_matches_the_per_perturbation_loop():
+    from src.montecarlo.templates import SensitivitySuiteParams, SensitivitySuiteTemplate
+
+    params = SensitivitySuiteParams(
+        base_result=0.05, base_ci_low=-0.1, base_ci_high=0.2, n_perturbations=200, seed=5
+    )
+    legacy = np.random.RandomState(5)
+    width = (params.base_ci_high - params.base_ci_low) * params.prior_widening_factor
+    flips = 0
+    for _ in range(params.n_perturbations):
+        perturbed = params.base_result + legacy.normal(0, params.prior_widening_factor * 0.1)
+        flips += (perturbed - width / 2) > 0 or (perturbed + width / 2) < 0
+
+    result = SensitivitySuiteTemplate().run(params)
+    assert result["flip_rate"] == flips / params.n_perturbations
+
+
+def test_contradiction_detect_pairs_every_supporting_with_every_refuting_item():
+    from src.montecarlo.templates import ContradictionDetectParams, ContradictionDetectTemplate
+
+    params = ContradictionDetectParams(
+        claim_id="c1",
+        evidence_items=[
+            {"id": "s1", "supports_claim": True},
+            {"id": "r1", "supports_claim": False},
+            {"id": "n1"},
+            {"supports_claim": True},
+        ],
+    )
+    result = ContradictionDetectTemplate().run(params)
+
+    assert result["contradictions"] == [
+        {"supporting_id": "s1", "refuting_id": "r1", "claim_id": "c1"},
+        {"supporting_id": "unknown", "refuting_id": "r1", "claim_id": "c1"},
+    ]
+    assert result["unresolved_count"] == 2 and result["has_conflicts"] is True
+
+
+def test_effect_direction_std_matches_numpy():
+    from src.montecarlo.templates import EffectDirectionParams, EffectDirectionTemplate
+
+    observations = [0.5, 1.5, 2.0, 4.0]
+    params = EffectDirectionParams(observations=observations, expected_direction="positive")
+    result = EffectDirectionTemplate().run(params)
+
+    mean, std = np.mean(observations), np.std(observations)
+    assert result["mean_value"] == pytest.approx(mean)
+    assert result["confidence"] == pytest.approx(min(1.0, mean / (std + 1e-9)))
+    assert result["actual_direction"] == "positive" and result["matches"] is True
+
+
+def test_bayesian_update_draws_from_its_own_rng():
+    from src.montecarlo.templates import BayesianUpdateParams, BayesianUpdateTemplate
+
+    params = BayesianUpdateParams(observations=[1.0, 3.0], seed=4)
+    np.random.seed(0)
+    before = np.random.get_state()[1].copy()
+
+    result = BayesianUpdateTemplate().run(params)
+
+    np.testing.assert_array_equal(np.random.get_state()[1], before)
+    legacy = np.random.RandomState(4)
+    samples = legacy.normal(result["posterior_mean"], result["posterior_std"], params.n_samples)
+    assert [result["ci_low"], result["ci_high"]] == list(np.quantile(samples, [0.025, 0.975]))
+
+
+def test_citation_check_counts_all_sources_but_returns_ten():
+    from src.montecarlo.templates import CitationCheckParams, CitationCheckTemplate
+
+    bundle = [{"claim_id": "c1", "source": f"s{i}"} for i in range(12)]
+    bundle += [{"hypothesis_id": "c1", "source": "", "source_id": "ignored"}]
+    bundle += [{"hypothesis_id": "c1", "source_id": "sid"}, {"claim_id": "other", "source": "x"}]
+    result = CitationCheckTemplate().run(CitationCheckParams(claim_id="c1", evidence_bundle=bundle))
+
+    assert result["citation_count"] == 13
+    assert result["sources"] == [f"s{i}" for i in range(10)]
+    assert result["has_citations"] is True
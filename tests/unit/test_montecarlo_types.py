@@ -0,0 +1,74 @@
+import pytest
+
+from src.montecarlo.types import ExperimentHints, ExperimentSpec, PriorSuggestion
+
+
+def test_experiment_hints_digest_is_pinned():
+    hints = ExperimentHints(
+        claim_id="c1",
+        candidate_mechanisms=["b", "a"],
+        sensitivity_axes=["x"],
+        prior_suggestions=[PriorSuggestion(domain="d", parallel="p")],
+        falsification_criteria=["é"],
+    )
+
+    # Recorded in audit trails: the canonical encoding must not drift
+    assert hints.digest() == "563a91d284085b9b"
+
+
+def _spec(params):
+    return ExperimentSpec(
+        claim_id="c1",
+        hypothesis="h",
+        template_qid="bootstrap_ci@1.0.0",
+        scope_lock_id="scope-1",
+        params=params,
+    )
+
+
+def test_nested_residue_is_rejected_with_its_path():
+    with pytest.raises(ValueError, match=r"params\.runs\[1\]\.lane"):
+        _spec({"runs": [{"n": 1}, {"lane": "grounded"}]})
+
+
+def test_residue_names_in_values_only_are_allowed():
+    spec = _spec({"note": "see the lane and analogies sections", "data": [1.0, 2.0]})
+
+    assert spec.params["data"] == [1.0, 2.0]
+
+
+def test_residue_walk_reports_first_violation_in_document_order():
+    params = {
+        "a": [{"ok": 1}, {"meta": {"epistemic_status": "speculative"}}],
+        "b": {"analogies": []},
+    }
+
+    with pytest.raises(ValueError, match=r"'params\.a\[1\]\.meta contains epistemic_status"):
+        _spec(params)
+
+
+def test_qid_must_match_in_full():
+    from src.montecarlo.types import QID_RE
+
+    assert QID_RE.fullmatch("bootstrap_ci@1.0.0")
+    # `$` alone would accept a trailing newline
+    assert QID_RE.fullmatch("bootstrap_ci@1.0.0\n") is None
+
+
+def test_residue_under_units_keys_is_rejected():
+    with pytest.raises(ValueError, match=r"'units\.lane'"):
+        ExperimentSpec(
+            claim_id="c1",
+            hypothesis="h",
+            template_qid="bootstrap_ci@1.0.0",
+            scope_lock_id="scope-1",
+            units={"lane": "mg"},
+        )
+
+
+def test_legacy_template_ids_map_to_registered_versions():
+    from src.montecarlo.types import LEGACY_TEMPLATE_TO_QID
+    from src.montecarlo.versioned_registry import VERSIONED_REGISTRY
+
+    registered = set(VERSIONED_REGISTRY.list_all())
+    assert set(LEGACY_TEMPLATE_TO_QID.values()) <= registered
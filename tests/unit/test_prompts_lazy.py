@@ -0,0 +1,20 @@
+import importlib
+
+import pytest
+
+import src.prompts as prompts
+
+
+def test_common_prompts_load_on_first_access():
+    module = importlib.reload(prompts)
+    assert "CODEACT_SYSTEM" not in vars(module)
+
+    from src.prompts import CODEACT_SYSTEM
+
+    assert CODEACT_SYSTEM == module.load_prompt("codeact_system")
+    assert vars(module)["CODEACT_SYSTEM"] is CODEACT_SYSTEM
+
+
+def test_unknown_attribute_still_raises():
+    with pytest.raises(AttributeError):
+        prompts.NOT_A_PROMPT
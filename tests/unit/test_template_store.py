@@ -72,3 +72,59 @@ def test_taint_template(store, meta):
     # Audit
     assert store.events[-1]["event_type"] == "tainted"
     assert store.events[-1]["actor"] == "Nina"
+
+
+def test_get_metadata_returns_stored_frozen_instance(store, meta):
+    store.insert_metadata(meta)
+
+    retrieved = store.get_metadata("test_tmpl", "1.0.0")
+    assert retrieved is meta
+    with pytest.raises(AttributeError):
+        retrieved.frozen = True
+
+
+def test_events_are_stored_column_wise(store, meta):
+    store.insert_metadata(meta)
+    store.freeze("test_tmpl", "1.0.0", "ev-123")
+
+    assert store.events.columns["event_type"] == ["registered", "frozen"]
+    assert [e["event_type"] for e in store.events] == ["registered", "frozen"]
+    assert store.events[-1]["created_at"].tzinfo is not None
+
+
+def test_filter_events_uses_template_and_type_indices(store, meta):
+    store.insert_metadata(meta)
+    store.freeze("test_tmpl", "1.0.0", "ev-1")
+    store.append_event("other", "1.0.0", "frozen", "system")
+
+    assert [e["event_type"] for e in store.filter_events(template_id="test_tmpl")] == [
+        "registered",
+        "frozen",
+    ]
+    assert [e["template_id"] for e in store.filter_events(event_type="frozen")] == [
+        "test_tmpl",
+        "other",
+    ]
+    (both,) = store.filter_events(template_id="other", event_type="frozen")
+    assert both["template_id"] == "other"
+    assert store.filter_events(template_id="missing") == []
+    assert len(store.filter_events()) == 3
+
+
+def test_event_columns_expose_raw_lists(store, meta):
+    store.insert_metadata(meta)
+
+    assert store.events.columns["event_type"] == ["registered"]
+    assert store.events.columns["template_id"] == ["test_tmpl"]
+
+
+def test_lifecycle_updates_replace_the_stored_metadata(store, meta):
+    store.insert_metadata(meta)
+    before = store.get_metadata("test_tmpl", "1.0.0")
+    store.freeze("test_tmpl", "1.0.0", "ev-1")
+    store.taint("test_tmpl", "1.0.0", "bug")
+
+    retrieved = store.metadata["test_tmpl@1.0.0"]
+    assert retrieved.frozen is True and retrieved.tainted is True
+    assert retrieved.first_evidence_id == "ev-1"
+    assert before.frozen is False and before.tainted is False
@@ -9,3 +9,13 @@ def test_iso_now_emits_datetime_without_timezone_suffix():
     assert literal.endswith("Z") is False
     assert "+" not in literal
     assert literal.count("T") == 1
+
+
+def test_iso_now_matches_naive_utc_isoformat(monkeypatch):
+    from datetime import datetime, timezone
+
+    monkeypatch.setattr(template_store.time, "time", lambda: 1767225600.75)
+
+    expected = datetime.fromtimestamp(1767225600, timezone.utc).replace(tzinfo=None)
+    assert template_store._iso_now() == expected.isoformat(timespec="seconds")
+    assert template_store._iso_now() == "2026-01-01T00:00:00"
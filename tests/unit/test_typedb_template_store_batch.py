@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import pytest
+
+typedb_driver = pytest.importorskip(
+    "typedb.driver", reason="TypeDB driver not available in this environment", exc_type=ImportError
+)
+
+from src.montecarlo import template_store  # noqa: E402
+from src.montecarlo.template_metadata import (  # noqa: E402
+    TemplateMetadata,
+    TemplateStatus,
+    TemplateVersion,
+)
+from src.montecarlo.template_store import TypeDBTemplateStore  # noqa: E402
+
+
+class _AttrConcept:
+    def __init__(self, value):
+        self._value = value
+
+    def is_attribute(self):
+        return True
+
+    def as_attribute(self):
+        return self
+
+    def get_value(self):
+        return self._value
+
+
+class _Row:
+    concept_type = _AttrConcept
+
+    def __init__(self, data):
+        self._data = {k: self.concept_type(v) for k, v in data.items()}
+
+    def column_names(self):
+        return list(self._data)
+
+    def get(self, col):
+        return self._data[col]
+
+
+class _Answer:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def as_concept_rows(self):
+        return [_Row(r) for r in self._rows]
+
+    def as_concept_documents(self):
+        return iter(self._rows)
+
+
+class _Resolved:
+    def __init__(self, answer=None):
+        self._answer = answer
+
+    def resolve(self):
+        return self._answer
+
+
+class _Tx:
+    def __init__(self, log, rows):
+        self.queries = []
+        self.committed = False
+        self._rows = rows
+        log.append(self)
+
+    def query(self, q):
+        self.queries.append(q)
+        if "select" in q or "fetch" in q:
+            return _Resolved(_Answer(self._rows))
+        return _Resolved()
+
+    def commit(self):
+        self.committed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Driver:
+    def __init__(self, rows=()):
+        self.txs = []
+        self.rows = list(rows)
+
+    def transaction(self, *_args, **_kwargs):
+        return _Tx(self.txs, self.rows)
+
+    def write_txs(self):
+        return [tx for tx in self.txs if tx.committed]
+
+
+def _meta(template_id="tmpl", version=(1, 0, 0)):
+    return TemplateMetadata(
+        template_id=template_id,
+        version=TemplateVersion(*version),
+        spec_hash="spec",
+        code_hash="code",
+        status=TemplateStatus.ACTIVE,
+    )
+
+
+def test_insert_many_writes_metadata_and_events_in_one_transaction():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+
+    store.insert_many([_meta("a"), _meta("b"), _meta("c")])
+
+    writes = driver.write_txs()
+    assert len(writes) == 1
+    (query,) = writes[0].queries
+    assert query.count("isa template-metadata") == 3
+    assert query.count("isa template-lifecycle-event") == 3
+    assert query.count("isa template-has-lifecycle-event") == 3
+
+
+def test_insert_many_chunks_by_batch_size_and_dedupes():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+    store.BATCH_SIZE = 2
+
+    store.insert_many([_meta("a"), _meta("a"), _meta("b"), _meta("c")])
+
+    writes = driver.write_txs()
+    assert [w.queries[0].count("isa template-metadata") for w in writes] == [2, 1]
+
+
+def _stored_row(template_id, version="1.0.0"):
+    return {
+        "tid": template_id,
+        "v": version,
+        "spec": "spec",
+        "code": "code",
+        "status": "active",
+        "frozen": False,
+        "tainted": False,
+    }
+
+
+def test_get_metadata_many_uses_one_disjunctive_read():
+    driver = _Driver(rows=[_stored_row("a"), _stored_row("b")])
+    store = TypeDBTemplateStore(driver)
+
+    found = store.get_metadata_many([("a", "1.0.0"), ("b", "1.0.0"), ("a", "1.0.0")])
+
+    assert len(driver.txs) == 1
+    assert driver.txs[0].queries[0].count(" or ") == 1
+    assert found[("a", "1.0.0")].spec_hash == "spec"
+    assert set(found) == {("a", "1.0.0"), ("b", "1.0.0")}
+
+
+def test_get_metadata_fetches_by_identity_pair():
+    driver = _Driver(rows=[_stored_row("a")])
+    store = TypeDBTemplateStore(driver)
+
+    meta = store.get_metadata("a", "1.0.0")
+
+    query = driver.txs[0].queries[0]
+    assert "fetch" in query and "has spec-hash" not in query
+    assert meta.code_hash == "code" and meta.frozen is False
+
+
+def test_get_metadata_treats_incomplete_entity_as_missing():
+    row = _stored_row("a")
+    row["status"] = None
+    store = TypeDBTemplateStore(_Driver(rows=[row]))
+
+    assert store.get_metadata("a", "1.0.0") is None
+
+
+def test_insert_many_skips_existing_after_one_existence_read():
+    driver = _Driver(rows=[_stored_row("a")])
+    store = TypeDBTemplateStore(driver)
+
+    store.insert_many([_meta("a"), _meta("b")])
+
+    reads = [tx for tx in driver.txs if not tx.committed]
+    assert len(reads) == 1
+    (write,) = driver.write_txs()
+    assert 'has template-id "a"' not in write.queries[0]
+    assert 'has template-id "b"' in write.queries[0]
+
+
+def test_insert_metadata_guards_existence_inside_the_write():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+
+    store.insert_metadata(_meta())
+
+    assert len(driver.txs) == 1
+    (query,) = driver.txs[0].queries
+    assert query.startswith("match not {")
+    assert 'has template-id "tmpl"' in query
+    assert 'has event-type "registered"' in query
+
+
+def test_append_events_share_one_commit():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+
+    store.append_events(
+        [
+            {"template_id": "a", "version": "1.0.0", "event_type": "note", "actor": "x"},
+            {"template_id": "b", "version": "1.0.0", "event_type": "note", "actor": "y"},
+        ]
+    )
+
+    (write,) = driver.write_txs()
+    assert len(write.queries) == 2
+
+
+def test_taint_is_a_single_match_delete_insert_pipeline():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+
+    store.taint("tmpl", "1.0.0", "bad", superseded_by="tmpl@1.0.1")
+
+    (write,) = driver.write_txs()
+    (query,) = write.queries
+    assert "has $old of $m;" in query
+    assert 'has superseded-by "tmpl@1.0.1"' in query
+    assert 'has event-type "tainted"' in query
+
+
+def _note(store, template_id):
+    store.append_event(template_id, "1.0.0", "note", "x")
+
+
+def test_append_event_writes_before_returning():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+
+    _note(store, "a")
+
+    (write,) = driver.write_txs()
+    assert 'has template-id "a"' in write.queries[0]
+
+
+def test_event_json_matches_sorted_json_dumps():
+    block = TypeDBTemplateStore._event_block(
+        "t", "1.0.0", "note", "x", "", {"b": 1, "a": [1, 2]}, "now"
+    )
+    assert 'has json "{\\"a\\": [1, 2], \\"b\\": 1}"' in block
+    assert 'has json "{}"' in TypeDBTemplateStore._event_block(
+        "t", "1.0.0", "note", "x", "", None, "now"
+    )
+
+
+def test_reregistering_known_metadata_skips_database():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+    store.insert_metadata(_meta("a"))
+    seen = len(driver.txs)
+
+    store.insert_metadata(_meta("a"))
+    store.insert_many([_meta("a")])
+
+    assert len(driver.txs) == seen
+
+
+class _RecordingDriver(_Driver):
+    def __init__(self):
+        super().__init__()
+        self.tx_args = []
+
+    def transaction(self, *args, **kwargs):
+        self.tx_args.append(args)
+        return super().transaction(*args, **kwargs)
+
+
+def test_bulk_options_apply_only_to_bulk_writes():
+    options = typedb_driver.TransactionOptions(transaction_timeout_millis=60_000)
+    driver = _RecordingDriver()
+    store = TypeDBTemplateStore(driver, bulk_options=options)
+
+    store.insert_many([_meta("a")])
+    store.freeze("a", "1.0.0", "ev-1")
+
+    bulk_write, freeze_write = driver.tx_args[-2:]
+    assert bulk_write[-1] is options
+    assert options not in freeze_write
+
+
+def test_freeze_escapes_identity_once_for_match_and_event():
+    driver = _Driver()
+    TypeDBTemplateStore(driver).freeze('a"b', "1.0.0", "ev-1")
+
+    query = driver.write_txs()[-1].queries[0]
+    assert query.count('has template-id "a\\"b"') == 2
+    assert "\\\\" not in query.split("has json")[0]
+
+
+def test_template_event_id_is_deterministic():
+    from src.montecarlo.template_store import _make_template_event_id
+
+    first = _make_template_event_id("t", "1.0.0", "frozen", "ev-1")
+    assert first == _make_template_event_id("t", "1.0.0", "frozen", "ev-1")
+    assert first.startswith("tevt-froz-")
+    assert first != _make_template_event_id("t", "1.0.0", "frozen", "ev-2")
+
+
+def test_freeze_many_shares_one_commit():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+
+    store.freeze_many(
+        [
+            {"template_id": "a", "version": "1.0.0", "evidence_id": "ev-1"},
+            {"template_id": "b", "version": "1.0.0", "evidence_id": "ev-2", "claim_id": "c"},
+        ]
+    )
+
+    (write,) = driver.write_txs()
+    assert len(write.queries) == 2
+    assert all("$frozen == false;" in q for q in write.queries)
+    assert 'has freeze-claim-id "c"' in write.queries[1]
+
+
+class _ProbeCountingConcept(_AttrConcept):
+    probes = 0
+
+    def is_attribute(self):
+        type(self).probes += 1
+        return True
+
+
+def test_read_query_probes_concept_kind_once_per_column(monkeypatch):
+    monkeypatch.setattr(_Row, "concept_type", _ProbeCountingConcept)
+    store = TypeDBTemplateStore(_Driver(rows=[{"tid": "a"}, {"tid": "b"}, {"tid": "c"}]))
+
+    rows = store._read_query("match $tid; select $tid;")
+
+    assert [r["tid"] for r in rows] == ["a", "b", "c"]
+    assert _ProbeCountingConcept.probes == 1
+
+
+def test_appended_event_ids_are_deterministic():
+    store = TypeDBTemplateStore(_Driver())
+    event = {"template_id": "a", "version": "1.0.0", "event_type": "note", "actor": "x"}
+
+    first = store._append_event_query(**event, created_at="2026-01-01T00:00:00")
+    replay = store._append_event_query(**event, created_at="2026-01-01T00:00:00")
+    other = store._append_event_query(**event, rationale="r", created_at="2026-01-01T00:00:00")
+
+    assert first == replay
+    assert first != other
+    evt_id = first.split('has entity-id "')[1].split('"')[0]
+    assert evt_id.startswith("tevt-note-")
+    assert "not {" not in first
+
+
+def _event_ids(write):
+    return [q.split('has entity-id "')[1].split('"')[0] for q in write.queries]
+
+
+def test_identical_events_in_one_batch_keep_distinct_ids():
+    driver = _Driver()
+    store = TypeDBTemplateStore(driver)
+    event = {"template_id": "a", "version": "1.0.0", "event_type": "verified", "actor": "x"}
+
+    store.append_events([event, event])
+
+    (write,) = driver.write_txs()
+    first, second = _event_ids(write)
+    assert first != second
+
+
+def test_only_identity_fields_go_through_the_escape_cache():
+    template_store._escape_id.cache_clear()
+    store = TypeDBTemplateStore(_Driver())
+
+    query = store._append_event_query("a", "1.0.0", "note", "x", rationale='unique "r"')
+
+    assert 'has rationale "unique \\"r\\""' in query
+    assert template_store._escape_id.cache_info().currsize == 4  # tid, version, type, actor
+    assert not hasattr(template_store._escape, "cache_info")
@@ -0,0 +1,350 @@
+"""
+Unit Tests: VersionedTemplateRegistry / TemplateSpec hashing
+"""
+
+import sys
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
+import pytest
+
+from src.montecarlo import template_metadata
+from src.montecarlo.template_metadata import (
+    TemplateCapability,
+    TemplateMetadata,
+    TemplateSpec,
+    TemplateStatus,
+    TemplateVersion,
+    VersionedTemplateRegistry,
+    compute_code_hash,
+)
+
+
+def _spec(**overrides) -> TemplateSpec:
+    kwargs = dict(
+        template_id="demo",
+        version=TemplateVersion(1, 0, 0),
+        description="demo template",
+        param_schema={"type": "object", "properties": {"b": {}, "a": {}}},
+        output_schema={"type": "object"},
+        invariants=["z", "a"],
+    )
+    kwargs.update(overrides)
+    return TemplateSpec(**kwargs)
+
+
+class TestTemplateSpecHashing:
+    def test_spec_hash_is_memoized(self):
+        spec = _spec()
+        first = spec.spec_hash()
+        assert spec._spec_hash == first
+        assert spec.spec_hash() is first
+
+    def test_spec_is_frozen(self):
+        spec = _spec()
+        with pytest.raises(FrozenInstanceError):
+            spec.description = "changed"
+
+    def test_sorted_views_built_at_construction(self):
+        spec = _spec()
+        assert spec._sorted_invariants == ("a", "z")
+        assert spec.invariants == ["z", "a"]
+
+    def test_invalidate_recomputes_after_in_place_mutation(self):
+        spec = _spec()
+        before = spec.spec_hash()
+        spec.invariants.append("m")
+        assert spec.spec_hash() == before
+        spec._invalidate()
+        assert spec._sorted_invariants == ("a", "m", "z")
+        assert spec.spec_hash() != before
+
+    def test_memo_fields_do_not_affect_equality(self):
+        a, b = _spec(), _spec()
+        a.spec_hash()
+        assert a == b
+
+    def test_canonical_json_matches_full_dict_encoding(self):
+        import json
+
+        spec = _spec(
+            description="naïve ≤ check",
+            capabilities={TemplateCapability.NETWORK, TemplateCapability.RANDOMNESS},
+            depends_on=["b@1.0.0", "a@1.0.0"],
+        )
+        expected = json.dumps(
+            {
+                "template_id": spec.template_id,
+                "version": "1.0.0",
+                "description": spec.description,
+                "param_schema": spec.param_schema,
+                "output_schema": spec.output_schema,
+                "invariants": sorted(spec.invariants),
+                "depends_on": sorted(spec.depends_on),
+                "capabilities": ["network", "randomness"],
+                "required_tests": [],
+                "deterministic": True,
+                "epistemic": spec.epistemic.to_canonical_dict(),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        assert spec.to_canonical_json() == expected
+
+
+class _Probe:
+    def run(self):
+        return 1
+
+
+class TestCodeHashCache:
+    def test_code_hash_cached_per_class(self):
+        first = compute_code_hash(_Probe)
+        with patch.object(template_metadata.inspect, "getsource") as getsource:
+            assert compute_code_hash(_Probe()) == first
+            getsource.assert_not_called()
+
+    def test_strict_failure_is_not_cached(self):
+        local_cls = type("Dynamic", (), {})
+        with pytest.raises(RuntimeError):
+            compute_code_hash(local_cls, strict=True)
+        assert local_cls not in template_metadata._CODE_HASH_CACHE
+
+    def test_refresh_rereads_edited_source(self, tmp_path, monkeypatch):
+        module_file = tmp_path / "edited_template.py"
+        module_file.write_text("class Edited:\n    def run(self):\n        return 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        import edited_template
+
+        before = compute_code_hash(edited_template.Edited)
+        module_file.write_text("class Edited:\n    def run(self):\n        return 1 + 10\n")
+
+        assert compute_code_hash(edited_template.Edited) == before
+        assert compute_code_hash(edited_template.Edited, refresh=True) != before
+
+
+class _Alpha:
+    def run(self):
+        return "alpha"
+
+
+class TestGetLatest:
+    def _registry(self):
+        registry = VersionedTemplateRegistry()
+        for version in [(1, 0, 0), (1, 10, 0), (1, 2, 0)]:
+            registry.register(_Alpha(), _spec(version=TemplateVersion(*version)))
+        registry.register(_Alpha(), _spec(template_id="demo_other"))
+        return registry
+
+    def test_returns_highest_active_version(self):
+        registry = self._registry()
+        assert registry.get_latest("demo") is registry.get("demo@1.10.0")
+
+    def test_skips_deprecated_versions(self):
+        registry = self._registry()
+        registry.deprecate("demo@1.10.0")
+        assert registry.get_latest("demo") is registry.get("demo@1.2.0")
+
+    def test_unknown_template_returns_none(self):
+        assert self._registry().get_latest("missing") is None
+        assert self._registry().get_latest("dem") is None
+
+
+class TestTemplateMetadataSerialization:
+    def test_iso_views_match_isoformat_and_survive_replace(self):
+        from dataclasses import replace
+        from datetime import datetime
+
+        meta = TemplateMetadata(
+            template_id="demo",
+            version=TemplateVersion(1, 0, 0),
+            spec_hash="s",
+            code_hash="c",
+            approved_at=datetime(2026, 1, 2, 3, 4, 5),
+        )
+        assert meta.to_dict()["approved_at"] == "2026-01-02T03:04:05"
+        assert meta.to_dict()["frozen_at"] is None
+
+        frozen = replace(meta, frozen=True, frozen_at=datetime(2026, 2, 1))
+        assert frozen.to_dict()["frozen_at"] == "2026-02-01T00:00:00"
+        assert TemplateMetadata.from_dict(frozen.to_dict()) == frozen
+
+    def test_plain_string_status_is_normalized_to_enum(self):
+        meta = TemplateMetadata(
+            template_id="demo",
+            version=TemplateVersion(1, 0, 0),
+            spec_hash="s",
+            code_hash="c",
+            status="deprecated",
+        )
+        assert meta.status is TemplateStatus.DEPRECATED
+
+
+class TestManifest:
+    def test_manifest_tracks_lifecycle_changes(self):
+        registry = VersionedTemplateRegistry()
+        spec = _spec(
+            depends_on=["b@1.0.0", "a@1.0.0"],
+            capabilities={TemplateCapability.RANDOMNESS},
+        )
+        qid = registry.register(_Alpha(), spec)
+        entry = registry.to_manifest()[qid]
+        assert entry["depends_on"] == ["a@1.0.0", "b@1.0.0"]
+        assert entry["capabilities"] == ["randomness"]
+        assert entry["frozen"] is False
+
+        registry.freeze(qid, evidence_id="ev-1")
+        registry.deprecate(qid)
+        entry = registry.to_manifest()[qid]
+        assert entry["frozen"] is True
+        assert entry["status"] == "deprecated"
+
+    def test_manifest_entries_are_copies(self):
+        registry = VersionedTemplateRegistry()
+        qid = registry.register(_Alpha(), _spec())
+        registry.to_manifest()[qid]["depends_on"].append("x@1.0.0")
+        assert registry.to_manifest()[qid]["depends_on"] == []
+
+
+class TestVerifyHashes:
+    def test_verify_detects_drift_by_default(self):
+        registry = VersionedTemplateRegistry()
+        spec = _spec()
+        qid = registry.register(_Alpha(), spec)
+
+        assert registry.verify_hashes(qid) is True
+        spec.invariants.append("drift")
+        assert registry.verify_hashes(qid) is False
+        assert registry.verify_hashes_force(qid) is False
+
+    def test_cached_verify_is_opt_in(self):
+        registry = VersionedTemplateRegistry()
+        spec = _spec()
+        qid = registry.register(_Alpha(), spec)
+
+        assert registry.verify_hashes(qid, use_cache=True) is True
+        with patch.object(template_metadata, "compute_code_hash") as code_hash:
+            assert registry.verify_hashes(qid, use_cache=True) is True
+            code_hash.assert_not_called()
+
+        spec.invariants.append("drift")
+        assert registry.verify_hashes(qid, use_cache=True) is True
+        assert registry.verify_hashes(qid) is False
+
+    def test_unknown_qid_fails(self):
+        registry = VersionedTemplateRegistry()
+        assert registry.verify_hashes("missing@1.0.0") is False
+        assert registry.verify_hashes_force("missing@1.0.0") is False
+
+    def test_verify_all_reports_each_template(self):
+        registry = VersionedTemplateRegistry()
+        drifting = _spec(version=TemplateVersion(1, 1, 0))
+        ok = registry.register(_Alpha(), _spec())
+        bad = registry.register(_Alpha(), drifting)
+        drifting.invariants.append("drift")
+
+        assert registry.verify_all() == {ok: True, bad: False}
+        assert registry.verify_all(use_cache=True) == {ok: True, bad: False}
+
+
+class TestListByStatus:
+    def test_buckets_follow_deprecation(self):
+        registry = VersionedTemplateRegistry()
+        first = registry.register(_Alpha(), _spec())
+        second = registry.register(_Alpha(), _spec(version=TemplateVersion(1, 1, 0)))
+
+        assert registry.list_by_status(TemplateStatus.ACTIVE) == [first, second]
+        assert registry.list_by_status(TemplateStatus.BANNED) == []
+
+        registry.deprecate(first)
+        registry.freeze(second, evidence_id="ev-1")
+        assert registry.list_by_status(TemplateStatus.ACTIVE) == [second]
+        assert registry.list_by_status(TemplateStatus.DEPRECATED) == [first]
+
+    def test_keeps_registration_order_across_transitions(self):
+        registry = VersionedTemplateRegistry()
+        qids = [
+            registry.register(_Alpha(), _spec(version=TemplateVersion(1, minor, 0)))
+            for minor in range(3)
+        ]
+
+        registry.deprecate(qids[2])
+        registry.deprecate(qids[0])
+        assert registry.list_by_status(TemplateStatus.DEPRECATED) == [qids[0], qids[2]]
+        assert registry.list_by_status(TemplateStatus.ACTIVE) == [qids[1]]
+
+
+class TestInterning:
+    def test_identifiers_are_interned(self):
+        registry = VersionedTemplateRegistry()
+        template_id = "".join(["de", "mo"])
+        qid = registry.register(_Alpha(), _spec(template_id=template_id))
+
+        assert registry.get_spec(qid).template_id is sys.intern("demo")
+        assert registry.get_metadata(qid).template_id is sys.intern("demo")
+        assert next(iter(registry._templates)) is sys.intern("demo@1.0.0")
+
+    def test_qualified_id_precomputed_on_spec_and_metadata(self):
+        registry = VersionedTemplateRegistry()
+        spec = _spec(version=TemplateVersion(2, 1, 3))
+        qid = registry.register(_Alpha(), spec)
+
+        assert qid is spec.qualified_id
+        assert spec.qualified_id == "demo@2.1.3"
+        assert registry.get_metadata(qid).qualified_id is qid
+        assert registry.freeze(qid, evidence_id="ev").qualified_id == qid
+
+
+class TestRegisterMany:
+    def test_registers_in_order(self):
+        registry = VersionedTemplateRegistry()
+        qids = registry.register_many(
+            [(_Alpha(), _spec()), (_Alpha(), _spec(version=TemplateVersion(1, 1, 0)))]
+        )
+        assert qids == ["demo@1.0.0", "demo@1.1.0"]
+        assert registry.get_latest("demo") is registry.get("demo@1.1.0")
+
+    def test_failure_leaves_registry_unchanged(self):
+        registry = VersionedTemplateRegistry()
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register_many([(_Alpha(), _spec()), (_Alpha(), _spec())])
+        assert registry.list_all() == []
+
+        with pytest.raises(RuntimeError):
+            registry.register_many([(_Alpha(), _spec()), (type("Dyn", (), {})(), _spec())])
+        assert registry.list_all() == []
+
+
+class TestTemplateVersionParse:
+    def test_parse_is_memoized(self):
+        assert TemplateVersion.parse("3.2.1") is TemplateVersion.parse("3.2.1")
+        assert TemplateVersion.parse("3.2.1") == TemplateVersion(3, 2, 1)
+
+    def test_invalid_versions_still_raise(self):
+        for bad in ("1.2", "1.x.3"):
+            with pytest.raises(ValueError):
+                TemplateVersion.parse(bad)
+            with pytest.raises(ValueError):
+                TemplateVersion.parse(bad)
+
+
+class TestVersionStr:
+    def test_version_str_and_qualified_id_are_precomputed(self):
+        meta = TemplateMetadata(
+            template_id="t", version=TemplateVersion(1, 2, 3), spec_hash="s", code_hash="c"
+        )
+
+        assert meta.version_str == "1.2.3"
+        assert meta.qualified_id == "t@1.2.3"
+        assert meta.to_dict()["version"] == "1.2.3"
+        assert "version_str" not in meta.to_dict()
+
+    def test_metadata_and_version_are_slotted(self):
+        meta = TemplateMetadata(
+            template_id="t", version=TemplateVersion(1, 2, 3), spec_hash="s", code_hash="c"
+        )
+
+        assert not hasattr(meta, "__dict__")
+        assert not hasattr(meta.version, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            meta.frozen = True